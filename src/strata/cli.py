@@ -164,7 +164,7 @@ def preview(recipe: str, bounds: str | None, open_svg: bool, output: str | None)
         strata preview recipe.yaml --open
     """
     from strata.maury import Recipe, Pipeline
-    import geopandas as gpd
+    from strata.thoreau import read_data
     from shapely.geometry import box
 
     console.print(f"\n[bold]Preview:[/] {recipe}\n")
@@ -220,7 +220,7 @@ def preview(recipe: str, bounds: str | None, open_svg: bool, output: str | None)
 
     for name, path in paths.items():
         try:
-            gdf = gpd.read_file(path)
+            gdf = read_data(path)
             total = len(gdf)
 
             # Count features intersecting bounds
@@ -391,9 +391,14 @@ def cache_list():
         if not scheme_dir.is_dir():
             continue
 
-        for item in scheme_dir.rglob("*.shp"):
-            # Get the parent directory (the dataset folder)
-            dataset_dir = item.parent
+        # Shapefiles plus the GeoParquet outputs of merged/filtered census data;
+        # a folder holding several data files is listed once
+        dataset_dirs = {
+            item.parent
+            for pattern in ("*.shp", "merged.parquet", "filtered.parquet")
+            for item in scheme_dir.rglob(pattern)
+        }
+        for dataset_dir in dataset_dirs:
             uri = f"{scheme_dir.name}:{dataset_dir.relative_to(scheme_dir)}"
 
             # Calculate size of all files in this directory
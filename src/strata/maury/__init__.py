@@ -31,7 +31,19 @@ Classes:
     LayerStack - Manage layer ordering and composition
 """
 
+from importlib import import_module
+from typing import Any
+
 from strata.maury.recipe import Recipe
-from strata.maury.pipeline import Pipeline
 
 __all__ = ["Recipe", "Pipeline"]
+
+
+def __getattr__(name: str) -> Any:
+    # Pipeline pulls in geopandas and the processing modules; import it on first
+    # use so `import strata` (and the recipe/TUI code paths) stay light
+    if name == "Pipeline":
+        pipeline = import_module("strata.maury.pipeline").Pipeline
+        globals()[name] = pipeline
+        return pipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
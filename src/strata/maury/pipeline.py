@@ -2,14 +2,23 @@
 Pipeline orchestration for strata build process.
 """
 
+import functools
+import hashlib
+import json
 from pathlib import Path
 from typing import Any
 
 import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pyproj
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
+import shapely
+from shapely import clip_by_rect
+from shapely.geometry import box
 
-from strata.maury.recipe import Recipe
+from strata.maury.recipe import Recipe, SVGOptions
 from strata import thoreau
 from strata import humboldt
 from strata import kelley
@@ -17,6 +26,100 @@ from strata import kelley
 console = Console()
 
 
+def _source_cache_path(
+    path: str,
+    bbox: tuple[float, float, float, float] | None,
+    filter_config: dict[str, Any] | None,
+) -> Path:
+    """
+    Get the GeoParquet cache path for a loaded source.
+
+    The key covers the file path, bbox and filter so that different
+    recipes reading the same file don't collide.
+    """
+    key = json.dumps(
+        [str(Path(path).resolve()), bbox, filter_config],
+        sort_keys=True,
+        default=str,
+    )
+    digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+    return thoreau.get_cache_dir() / "sources" / f"{digest}.parquet"
+
+
+def _clip_to_box(gdf: gpd.GeoDataFrame, bounds: list[float]) -> gpd.GeoDataFrame:
+    """
+    Clip a GeoDataFrame to a bounding box, dropping empty results.
+
+    Candidates are narrowed with the spatial index first, then clipped and
+    checked for emptiness in one pass over the geometry array.
+    """
+    idx = np.sort(gdf.sindex.query(box(*bounds), predicate="intersects"))
+    candidates = gdf.iloc[idx]
+
+    geoms = np.asarray(candidates.geometry.values)
+    # Points already intersect the box, so they pass through unchanged
+    # (the same rule geopandas applies for rectangle masks)
+    is_point = shapely.get_type_id(geoms) == 0
+    geoms = np.where(is_point, geoms, clip_by_rect(geoms, *bounds))
+    keep = ~shapely.is_empty(geoms)
+
+    clipped = candidates.iloc[np.flatnonzero(keep)].copy()
+    clipped[clipped.geometry.name] = geoms[keep]
+    return clipped
+
+
+@functools.lru_cache(maxsize=32)
+def _equal_area_transformer(src_crs: pyproj.CRS) -> pyproj.Transformer:
+    """Get a cached transformer from src_crs to the EPSG:6933 equal area projection."""
+    return pyproj.Transformer.from_crs(src_crs, "EPSG:6933", always_xy=True)
+
+
+def _area_km2(gdf: gpd.GeoDataFrame) -> np.ndarray:
+    """Compute feature areas in square kilometers using an equal area projection."""
+    transformer = _equal_area_transformer(gdf.crs)
+
+    def project(coords: np.ndarray) -> np.ndarray:
+        x, y = transformer.transform(coords[:, 0], coords[:, 1])
+        return np.column_stack([x, y])
+
+    projected = shapely.transform(np.asarray(gdf.geometry.values), project)
+    areas: np.ndarray = shapely.area(projected)
+    return areas / 1e6
+
+
+def _optimize_dtypes(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    """
+    Shrink attribute columns in place to reduce memory.
+
+    Integers are downcast to the smallest type that holds them, floats only
+    when the downcast is lossless, and repetitive strings (FIPS codes, MTFCC)
+    become categoricals.
+    """
+    for col in gdf.columns:
+        if col == gdf.geometry.name:
+            continue
+        series = gdf[col]
+
+        if pd.api.types.is_bool_dtype(series):
+            continue
+        elif pd.api.types.is_integer_dtype(series):
+            gdf[col] = pd.to_numeric(series, downcast="integer")
+        elif pd.api.types.is_float_dtype(series):
+            downcast = pd.to_numeric(series, downcast="float")
+            if np.array_equal(downcast.to_numpy(), series.to_numpy(), equal_nan=True):
+                gdf[col] = downcast
+        elif pd.api.types.is_string_dtype(series):
+            try:
+                repetitive = series.nunique() < len(series) / 2
+            except TypeError:
+                # Object columns holding lists/dicts can't be hashed
+                continue
+            if repetitive:
+                gdf[col] = series.astype("category")
+
+    return gdf
+
+
 class Pipeline:
     """
     Orchestrates the strata build process.
@@ -30,27 +133,28 @@ class Pipeline:
         self.sources: dict[str, gpd.GeoDataFrame] = {}
         self.layers: dict[str, gpd.GeoDataFrame] = {}
 
-    def estimate(self) -> dict:
+    def estimate(self) -> dict[str, Any]:
         """
         Estimate download sizes without downloading.
 
         Returns:
             Dict with total_size_mb, sources list, cached count
         """
-        estimates = []
-        total_mb = 0
-        cached_count = 0
-
-        for name, source_config in self.recipe.sources.items():
-            uri = source_config.uri
-            est = thoreau.estimate_size(uri)
-            est["name"] = name
-            estimates.append(est)
-
-            if est.get("cached"):
-                cached_count += 1
-            else:
-                total_mb += est.get("estimated_size_mb", 0)
+        estimates = [
+            dict(thoreau.estimate_size(source_config.uri), name=name)
+            for name, source_config in self.recipe.sources.items()
+        ]
+
+        cached = np.fromiter(
+            (bool(est.get("cached")) for est in estimates), dtype=bool, count=len(estimates)
+        )
+        sizes = np.fromiter(
+            (est.get("estimated_size_mb", 0) or 0 for est in estimates),
+            dtype=np.float64,
+            count=len(estimates),
+        )
+        total_mb = float(sizes[~cached].sum())
+        cached_count = int(cached.sum())
 
         return {
             "sources": estimates,
@@ -71,17 +175,19 @@ class Pipeline:
         """
         console.print("\n[bold]Fetching sources:[/]")
 
+        names = list(self.recipe.sources)
+        uris = [self.recipe.sources[name].uri for name in names]
+        results = thoreau.fetch_many(uris, force=force, return_exceptions=True)
+
         paths = {}
-        for name, source_config in self.recipe.sources.items():
-            uri = source_config.uri
-            try:
-                path = thoreau.fetch(uri, force=force)
-                paths[name] = path
-            except NotImplementedError as e:
-                console.print(f"  [yellow]![/] {name}: {e}")
-            except Exception as e:
-                console.print(f"  [red]✗[/] {name}: {e}")
-                raise
+        for name, result in zip(names, results):
+            if isinstance(result, NotImplementedError):
+                console.print(f"  [yellow]![/] {name}: {result}")
+            elif isinstance(result, Exception):
+                console.print(f"  [red]✗[/] {name}: {result}")
+                raise result
+            else:
+                paths[name] = result
 
         return paths
 
@@ -96,25 +202,45 @@ class Pipeline:
 
         # Get bounds for early spatial filtering if specified
         bounds_config = self.recipe.output.bounds
-        bbox = None
+        bbox: tuple[float, float, float, float] | None = None
         if isinstance(bounds_config, list) and len(bounds_config) == 4:
-            bbox = tuple(bounds_config)
+            west, south, east, north = bounds_config
+            bbox = (west, south, east, north)
 
         for name, path in paths.items():
+            source_config = self.recipe.sources.get(name)
+            filter_config = source_config.filter if source_config else None
+            cache_path = _source_cache_path(path, bbox, filter_config)
+
+            # Reuse the parsed result from a previous build if the source is unchanged
+            if cache_path.exists() and cache_path.stat().st_mtime >= Path(path).stat().st_mtime:
+                gdf = gpd.read_parquet(cache_path)
+                self.sources[name] = gdf
+                _ = gdf.sindex  # build the spatial index now
+                console.print(f"  [green]✓[/] {name}: {len(gdf)} features [dim](cached)[/]")
+                continue
+
             console.print(f"  Loading {name}...")
 
             # Use bbox parameter to filter on load (reduces memory for large datasets)
-            if bbox:
-                gdf = gpd.read_file(path, bbox=bbox)
-            else:
-                gdf = gpd.read_file(path)
+            gdf = thoreau.read_data(path, bbox=bbox)
 
             # Apply filters if specified
-            source_config = self.recipe.sources.get(name)
-            if source_config and source_config.filter:
-                gdf = self._apply_filter(gdf, source_config.filter)
+            if filter_config:
+                gdf = self._apply_filter(gdf, filter_config)
+
+            gdf = _optimize_dtypes(gdf)
+
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                gdf.to_parquet(cache_path, compression="zstd", schema_version="1.0.0")
+            except Exception as e:
+                # Caching is best-effort; some attribute types can't be stored
+                cache_path.unlink(missing_ok=True)
+                console.print(f"    [dim]Not cached: {e}[/]")
 
             self.sources[name] = gdf
+            _ = gdf.sindex  # build the spatial index now
             console.print(f"  [green]✓[/] {name}: {len(gdf)} features")
 
     def _apply_filter(
@@ -139,51 +265,58 @@ class Pipeline:
               FULLNAME_contains: "Champlain"   # Substring match
               RTTYP: "I"                        # Interstate roads only
         """
-        result = gdf
-        original_count = len(result)
+        masks: list[np.ndarray] = []
+        area_km2 = None
 
         for key, value in filter_config.items():
-            if key == "min_area_km2":
-                # Filter by minimum area
-                temp = result.to_crs("epsg:6933")  # Equal area projection
-                area_km2 = temp.geometry.area / 1e6
-                result = result[area_km2 >= value]
-
-            elif key == "max_area_km2":
-                temp = result.to_crs("epsg:6933")
-                area_km2 = temp.geometry.area / 1e6
-                result = result[area_km2 <= value]
+            if key in ("min_area_km2", "max_area_km2"):
+                if area_km2 is None:
+                    # Computed once and shared by both bounds
+                    area_km2 = _area_km2(gdf)
+                if key == "min_area_km2":
+                    masks.append(area_km2 >= value)
+                else:
+                    masks.append(area_km2 <= value)
 
             elif key.endswith("_contains"):
                 # Substring match (case-insensitive)
                 column = key[:-9]  # Remove "_contains" suffix
-                if column in result.columns:
-                    result = result[
-                        result[column].str.contains(value, case=False, na=False)
-                    ]
+                if column in gdf.columns:
+                    values = gdf[column]
+                    if isinstance(values.dtype, pd.CategoricalDtype):
+                        values = values.astype("string")
+                    masks.append(
+                        values.str.contains(value, case=False, na=False).to_numpy(dtype=bool)
+                    )
 
             elif key.endswith("_in"):
                 # Explicit list match
                 column = key[:-3]  # Remove "_in" suffix
-                if column in result.columns:
+                if column in gdf.columns:
                     values = value if isinstance(value, list) else [value]
-                    result = result[result[column].isin(values)]
+                    masks.append(gdf[column].isin(values).to_numpy(dtype=bool))
 
             elif key == "counties":
                 # Filter by county names (for TIGER data)
-                if "NAMELSAD" in result.columns:
+                if "NAMELSAD" in gdf.columns:
                     # County subdivisions have NAMELSAD
                     pass  # TODO: Need county info for filtering
-                elif "COUNTYFP" in result.columns:
+                elif "COUNTYFP" in gdf.columns:
                     # Would need county name lookup
                     pass
 
-            elif key in result.columns:
+            elif key in gdf.columns:
                 # Direct column filter (exact match or list)
                 if isinstance(value, list):
-                    result = result[result[key].isin(value)]
+                    masks.append(gdf[key].isin(value).to_numpy(dtype=bool))
                 else:
-                    result = result[result[key] == value]
+                    masks.append((gdf[key] == value).to_numpy(dtype=bool, na_value=False))
+
+        # Combine all filters and subset once
+        if not masks:
+            return gdf
+        original_count = len(gdf)
+        result = gdf.iloc[np.flatnonzero(np.logical_and.reduce(masks))]
 
         # Log filtering result if significant reduction
         if len(result) < original_count:
@@ -219,11 +352,12 @@ class Pipeline:
                 console.print(f"  [yellow]![/] {name}: No sources found")
                 continue
 
-            # Concatenate if multiple sources
+            # Concatenate if multiple sources. A single source is used as-is:
+            # every later step returns a new frame, and clipping can then
+            # reuse the source's spatial index.
             if len(source_gdfs) == 1:
-                gdf = source_gdfs[0].copy()
+                gdf = source_gdfs[0]
             else:
-                import pandas as pd
                 # Normalize CRS before concatenating (US=NAD83, Canada=NAD83(CSRS))
                 # Use WGS84 (EPSG:4326) as common CRS for merging
                 target_crs = "EPSG:4326"
@@ -240,11 +374,8 @@ class Pipeline:
 
             # Apply layer-level bounds clipping if specified
             if layer_config.bounds and len(layer_config.bounds) == 4:
-                from shapely.geometry import box
                 original_count = len(gdf)
-                clip_box = box(*layer_config.bounds)
-                gdf = gdf.clip(clip_box)
-                gdf = gdf[~gdf.geometry.is_empty]
+                gdf = _clip_to_box(gdf, layer_config.bounds)
                 console.print(
                     f"    [dim]Clipped to bounds: {original_count} → {len(gdf)} features[/]"
                 )
@@ -278,17 +409,11 @@ class Pipeline:
             return
 
         if isinstance(bounds_config, list) and len(bounds_config) == 4:
-            from shapely.geometry import box
-            clip_box = box(*bounds_config)
-
             console.print(f"\n[bold]Clipping to bounds:[/] {bounds_config}")
 
             for name, gdf in self.layers.items():
                 original_count = len(gdf)
-                # Clip geometries to the bounding box
-                clipped = gdf.clip(clip_box)
-                # Remove empty geometries
-                clipped = clipped[~clipped.geometry.is_empty]
+                clipped = _clip_to_box(gdf, bounds_config)
                 self.layers[name] = clipped
                 console.print(f"  {name}: {original_count} → {len(clipped)} features")
 
@@ -332,7 +457,6 @@ class Pipeline:
         # Get output options
         options = format_config.options
         if options is None:
-            from strata.maury.recipe import SVGOptions
             options = SVGOptions()
 
         page_size = tuple(options.page_size)
@@ -425,7 +549,6 @@ class Pipeline:
                     all_bounds.append(gdf.total_bounds)
 
             if all_bounds:
-                import numpy as np
                 all_bounds = np.array(all_bounds)
                 return (
                     all_bounds[:, 0].min(),
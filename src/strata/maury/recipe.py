@@ -2,11 +2,19 @@
 Recipe parser and validator for .strata.yaml files.
 """
 
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import yaml
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+
+# Prefer the libyaml C implementation when PyYAML was built with it
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Top-level keys returned by Recipe.peek_header
+HEADER_KEYS = frozenset({"name", "description", "version"})
 
 
 class SourceConfig(BaseModel):
@@ -30,8 +38,14 @@ class OperationConfig(BaseModel):
     distance: float | None = None
 
 
-class StyleConfig(BaseModel):
-    """Configuration for layer styling."""
+@dataclass(frozen=True, slots=True)
+class StyleConfig:
+    """
+    Configuration for layer styling.
+
+    Leaf configs are plain frozen dataclasses; pydantic validates them as
+    fields of the enclosing models without per-instance model overhead.
+    """
 
     stroke: str = "#333333"
     stroke_width: float = 1.0
@@ -61,32 +75,36 @@ class LayerConfig(BaseModel):
     order: int
 
 
-class QualityConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class QualityConfig:
     """Configuration for a quality level."""
 
     name: str
     simplify: float
 
 
-class SVGOptions(BaseModel):
+@dataclass(frozen=True, slots=True)
+class SVGOptions:
     """Options for SVG output."""
 
     per_layer: bool = True
     combined: bool = True
     optimize_for: str = "plotter"
     stroke_units: str = "mm"
-    page_size: list[float] = Field(default_factory=lambda: [11, 17])
+    page_size: list[float] = field(default_factory=lambda: [11, 17])
     margin: float = 0.5
 
 
-class GeoJSONOptions(BaseModel):
+@dataclass(frozen=True, slots=True)
+class GeoJSONOptions:
     """Options for GeoJSON output."""
 
     per_layer: bool = True
     precision: int = 6
 
 
-class PMTilesOptions(BaseModel):
+@dataclass(frozen=True, slots=True)
+class PMTilesOptions:
     """Options for PMTiles output."""
 
     minzoom: int = 4
@@ -139,19 +157,54 @@ class Recipe(BaseModel):
         """Load a recipe from a YAML file."""
         path = Path(path)
         with open(path) as f:
-            data = yaml.safe_load(f)
-        return cls.model_validate(data)
+            data = yaml.load(f, Loader=Loader)
+        return _RECIPE_ADAPTER.validate_python(data)
+
+    @classmethod
+    def peek_header(cls, path: str | Path) -> dict[str, Any]:
+        """
+        Read a recipe's name, version and description without loading it.
+
+        Only the lines before the first other top-level key (usually
+        ``sources:``) are parsed, and nothing is validated. Falls back to a
+        full load if that prefix can't be parsed on its own.
+        """
+        head = []
+        with open(path) as f:
+            for line in f:
+                if line[:1].isalpha() and line.split(":", 1)[0] not in HEADER_KEYS:
+                    break
+                head.append(line)
+
+        try:
+            data = yaml.load("".join(head), Loader=Loader)
+        except yaml.YAMLError:
+            data = None
+        if not isinstance(data, dict) or "name" not in data:
+            recipe = cls.from_file(path)
+            data = {
+                "name": recipe.name,
+                "version": recipe.version,
+                "description": recipe.description,
+            }
+
+        return {
+            "name": data.get("name"),
+            "version": data.get("version", 1),
+            "description": data.get("description", ""),
+        }
 
     @classmethod
     def from_yaml(cls, yaml_string: str) -> "Recipe":
         """Load a recipe from a YAML string."""
-        data = yaml.safe_load(yaml_string)
-        return cls.model_validate(data)
+        data = yaml.load(yaml_string, Loader=Loader)
+        return _RECIPE_ADAPTER.validate_python(data)
 
     def to_yaml(self) -> str:
         """Export recipe as YAML."""
         return yaml.dump(
             self.model_dump(exclude_none=True),
+            Dumper=Dumper,
             default_flow_style=False,
             sort_keys=False,
             allow_unicode=True,
@@ -187,3 +240,7 @@ class Recipe(BaseModel):
                             )
 
         return errors
+
+
+# Built once at import so recipe loads reuse the compiled core schema
+_RECIPE_ADAPTER = TypeAdapter(Recipe)
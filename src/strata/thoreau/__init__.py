@@ -7,6 +7,14 @@ by having to pull so much harder before the water got underneath to help me."
     — Henry David Thoreau, Walden
 """
 
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import geopandas as gpd
+from rich.console import Console
+
 from .census import fetch_census, parse_census_uri, estimate_census_size
 from .quebec import fetch_quebec, parse_quebec_uri, estimate_quebec_size
 from .canada import fetch_canada, parse_canada_uri, estimate_canada_size
@@ -14,7 +22,9 @@ from .cache import get_cache_dir, is_cached, get_cached_path, clear_cache
 
 __all__ = [
     "fetch",
+    "fetch_many",
     "estimate_size",
+    "read_data",
     "fetch_census",
     "parse_census_uri",
     "estimate_census_size",
@@ -30,6 +40,50 @@ __all__ = [
     "clear_cache",
 ]
 
+# Skip rich's highlighting pass when output is piped (it would be stripped anyway)
+console = Console(highlight=sys.stdout.isatty())
+
+
+def _fetch_file(uri: str, force: bool = False) -> str:
+    """Validate a local file URI and return its path."""
+
+    _, _, local_path = uri.partition(":")  # Strip "file:" prefix
+
+    # Handle relative paths
+    path = Path(local_path)
+    if not path.is_absolute():
+        # Try relative to cwd
+        path = Path.cwd() / local_path
+
+    if not path.exists():
+        raise FileNotFoundError(f"Local file not found: {path}")
+
+    console.print(f"  [green]✓[/] {uri} [dim](local)[/]")
+    return str(path)
+
+
+def _estimate_file_size(uri: str) -> dict[str, Any]:
+    """Report the size of a local file URI."""
+    path = Path(uri.partition(":")[2])
+    size_mb = path.stat().st_size / 1024 / 1024 if path.exists() else 0
+    return {"uri": uri, "estimated_size_mb": size_mb, "cached": True, "cache_path": str(path)}
+
+
+# Handlers by URI scheme (the part before the first ":")
+_FETCH = {
+    "census": fetch_census,
+    "canada": fetch_canada,
+    "quebec": fetch_quebec,
+    "file": _fetch_file,
+}
+
+_ESTIMATE = {
+    "census": estimate_census_size,
+    "canada": estimate_canada_size,
+    "quebec": estimate_quebec_size,
+    "file": _estimate_file_size,
+}
+
 
 def fetch(uri: str, force: bool = False) -> str:
     """
@@ -40,42 +94,108 @@ def fetch(uri: str, force: bool = False) -> str:
         force: Re-download even if cached
 
     Returns:
-        Path to local data file (shapefile or geojson)
+        Path to local data file (shapefile, geojson or GeoParquet)
 
     Raises:
         ValueError: If URI scheme is not recognized
         FileNotFoundError: If local file doesn't exist
     """
-    from pathlib import Path
-    from rich.console import Console
-    console = Console()
-
-    if uri.startswith("census:"):
-        return fetch_census(uri, force=force)
-    elif uri.startswith("canada:"):
-        return fetch_canada(uri, force=force)
-    elif uri.startswith("quebec:"):
-        return fetch_quebec(uri, force=force)
-    elif uri.startswith("file:"):
-        # Local file - validate and return the path
-        local_path = uri[5:]  # Strip "file:" prefix
-
-        # Handle relative paths
-        path = Path(local_path)
-        if not path.is_absolute():
-            # Try relative to cwd
-            path = Path.cwd() / local_path
-
-        if not path.exists():
-            raise FileNotFoundError(f"Local file not found: {path}")
-
-        console.print(f"  [green]✓[/] {uri} [dim](local)[/]")
-        return str(path)
-    else:
+    scheme, sep, _ = uri.partition(":")
+    handler = _FETCH.get(scheme) if sep else None
+    if handler is None:
         raise ValueError(f"Unknown source URI scheme: {uri}")
+    return handler(uri, force=force)
+
+
+def read_data(
+    path: str | Path, bbox: tuple[float, float, float, float] | None = None
+) -> gpd.GeoDataFrame:
+    """
+    Read a fetched data file into a GeoDataFrame.
+
+    GeoParquet outputs are read through Arrow directly; everything else goes
+    through OGR.
+
+    Args:
+        path: Path returned by fetch()
+        bbox: Optional (minx, miny, maxx, maxy) to keep only intersecting features
+
+    Returns:
+        GeoDataFrame
+    """
+    if str(path).endswith(".parquet"):
+        gdf = gpd.read_parquet(path)
+        if bbox:
+            minx, miny, maxx, maxy = bbox
+            gdf = gdf.cx[minx:maxx, miny:maxy]
+        return gdf
+    return gpd.read_file(path, bbox=bbox)
+
+
+def _download_key(uri: str) -> str:
+    """
+    Get a key identifying the download a URI is served from.
+
+    URIs with the same key share a cache directory (e.g. NHN rivers and
+    waterbody, or Quebec layers from one archive) and must not download
+    concurrently.
+    """
+    try:
+        if uri.startswith("quebec:"):
+            return f"quebec:{parse_quebec_uri(uri)['source']}"
+        return str(get_cached_path(uri))
+    except ValueError:
+        # Invalid URI; fetch() will report the error
+        return uri
+
+
+def fetch_many(
+    uris: list[str],
+    force: bool = False,
+    max_workers: int = 4,
+    return_exceptions: bool = False,
+) -> list[str | Exception]:
+    """
+    Fetch several source URIs concurrently.
+
+    Downloads are network-bound, so independent sources are fetched on a
+    thread pool; URIs sharing a download are fetched in order on one thread.
+
+    Args:
+        uris: Source URIs
+        force: Re-download even if cached
+        max_workers: Maximum number of concurrent downloads
+        return_exceptions: Return exceptions in place of paths instead of
+            raising the first one
+
+    Returns:
+        List of local paths (or exceptions), in the same order as uris
+    """
+    groups: dict[str, list[int]] = {}
+    for i, uri in enumerate(uris):
+        groups.setdefault(_download_key(uri), []).append(i)
+
+    results: list[str | Exception] = [""] * len(uris)
+
+    def fetch_group(indices: list[int]) -> None:
+        for i in indices:
+            try:
+                results[i] = fetch(uris[i], force=force)
+            except Exception as e:
+                results[i] = e
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        list(pool.map(fetch_group, groups.values()))
+
+    if not return_exceptions:
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+
+    return results
 
 
-def estimate_size(uri: str) -> dict:
+def estimate_size(uri: str) -> dict[str, Any]:
     """
     Estimate download size for a URI without downloading.
 
@@ -85,16 +205,8 @@ def estimate_size(uri: str) -> dict:
     Returns:
         Dict with estimated_size_mb, cached, cache_path, url
     """
-    if uri.startswith("census:"):
-        return estimate_census_size(uri)
-    elif uri.startswith("canada:"):
-        return estimate_canada_size(uri)
-    elif uri.startswith("quebec:"):
-        return estimate_quebec_size(uri)
-    elif uri.startswith("file:"):
-        from pathlib import Path
-        path = Path(uri[5:])
-        size_mb = path.stat().st_size / 1024 / 1024 if path.exists() else 0
-        return {"uri": uri, "estimated_size_mb": size_mb, "cached": True, "cache_path": str(path)}
-    else:
+    scheme, sep, _ = uri.partition(":")
+    handler = _ESTIMATE.get(scheme) if sep else None
+    if handler is None:
         return {"uri": uri, "estimated_size_mb": 0, "cached": False, "error": "Unknown scheme"}
+    return handler(uri)
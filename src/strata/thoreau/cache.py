@@ -2,18 +2,33 @@
 Cache management for downloaded data.
 """
 
+import json
+import os
+import shutil
+import time
+import zipfile
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 
 from platformdirs import user_cache_dir
 
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking
+    fcntl = None  # type: ignore[assignment]
 
+
+@lru_cache(maxsize=1)
 def get_cache_dir() -> Path:
-    """Get the strata cache directory, creating it if needed."""
+    """Get the strata cache directory, creating it on first use."""
     cache_dir = Path(user_cache_dir("strata", "dirtybirdnj"))
     cache_dir.mkdir(parents=True, exist_ok=True)
     return cache_dir
 
 
+@lru_cache(maxsize=1024)
 def get_cached_path(uri: str) -> Path:
     """
     Get the cache path for a given URI.
@@ -39,6 +54,204 @@ def get_cached_path(uri: str) -> Path:
     return get_cache_dir() / safe_path
 
 
+MANIFEST_NAME = ".strata_manifest.json"
+
+# HTTP validators of a download: {"etag": ..., "last_modified": ...}
+Validators = dict[str, str]
+
+# Lock file serializing downloads of an entry across processes
+LOCK_NAME = ".strata.lock"
+
+# Present while an entry is being downloaded; left behind by an interrupted fetch
+PARTIAL_NAME = ".strata_partial"
+
+# Bumped when the layout of cached outputs changes (2: GeoParquet merged/filtered files)
+MANIFEST_VERSION = 2
+
+# Seconds between checks of a cached entry against the server
+FRESHNESS_CHECK_TTL = 7 * 24 * 60 * 60
+
+# Seconds to wait on a freshness check before treating the server as unreachable
+FRESHNESS_CHECK_TIMEOUT = 5.0
+
+# Extensions of the data files strata can read from the cache
+DATA_SUFFIXES = (".shp", ".geojson", ".parquet")
+
+
+def iter_data_files(root: Path, suffixes: tuple[str, ...] = (".shp",)) -> Iterator[Path]:
+    """
+    Yield data files under root with one of the given suffixes.
+
+    Walks the tree with os.walk and only builds Path objects for matches,
+    so callers that stop at the first hit don't scan the whole archive.
+    """
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            if filename.lower().endswith(suffixes):
+                yield Path(dirpath) / filename
+
+
+# Copy buffer for archive extraction; zipfile's default is 64 KiB
+EXTRACT_CHUNK_SIZE = 1 << 20
+
+
+def extract_archive(zf: zipfile.ZipFile, dest: Path, names: list[str] | None = None) -> None:
+    """
+    Extract archive members to a directory using large copy buffers.
+
+    Args:
+        zf: Open archive
+        dest: Directory to extract into
+        names: Members to extract (default: all)
+
+    Raises:
+        ValueError: If a member would be written outside dest
+    """
+    dest = Path(dest).resolve()
+    members = zf.infolist() if names is None else [zf.getinfo(name) for name in names]
+    for info in members:
+        target = (dest / info.filename).resolve()
+        if not target.is_relative_to(dest):
+            raise ValueError(f"Unsafe path in archive: {info.filename}")
+        if info.is_dir():
+            target.mkdir(parents=True, exist_ok=True)
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with zf.open(info) as src, open(target, "wb") as dst:
+            shutil.copyfileobj(src, dst, EXTRACT_CHUNK_SIZE)
+
+
+@contextmanager
+def entry_lock(cache_path: Path) -> Iterator[None]:
+    """
+    Hold an exclusive cross-process lock on a cache entry.
+
+    Concurrent strata processes fetching the same entry take turns; the one
+    that waited then finds the finished entry in its cache check.
+    """
+    cache_path.mkdir(parents=True, exist_ok=True)
+    with open(cache_path / LOCK_NAME, "a") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        yield
+
+
+def mark_incomplete(cache_path: Path) -> None:
+    """
+    Mark a cache entry as being (re)downloaded.
+
+    The manifest is removed so the old files are no longer served, and the
+    marker keeps a partial extraction from passing as a pre-manifest cache.
+    write_manifest() clears the marker once the entry is complete.
+    """
+    (cache_path / MANIFEST_NAME).unlink(missing_ok=True)
+    (cache_path / PARTIAL_NAME).touch()
+
+
+def write_manifest(
+    cache_path: Path,
+    files: list[Path],
+    validators: dict[str, Validators] | None = None,
+) -> None:
+    """
+    Record the extracted data files for a cache entry.
+
+    The manifest lets cache hits find their files with a single read instead
+    of walking the extracted archive.
+
+    Args:
+        cache_path: Cache directory for the entry
+        files: Data files inside cache_path
+        validators: HTTP validators ({url: {"etag": ..., "last_modified": ...}})
+            of the downloads, used to detect upstream changes
+    """
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "files": [str(Path(f).relative_to(cache_path)) for f in files],
+        "fetched_at": time.time(),
+    }
+    # Downloads whose responses had no validators can't be checked later
+    validators = {url: v for url, v in (validators or {}).items() if v}
+    if validators:
+        manifest["validators"] = validators
+    tmp_path = cache_path / f"{MANIFEST_NAME}.tmp"
+    tmp_path.write_text(json.dumps(manifest))
+    os.replace(tmp_path, cache_path / MANIFEST_NAME)
+    (cache_path / PARTIAL_NAME).unlink(missing_ok=True)
+
+
+def read_manifest(cache_path: Path) -> list[Path] | None:
+    """
+    Read the data files recorded for a cache entry.
+
+    Args:
+        cache_path: Cache directory for the entry
+
+    Returns:
+        List of data file paths, or None if there is no manifest
+    """
+    try:
+        manifest = json.loads((cache_path / MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return None
+    return [cache_path / f for f in manifest["files"]]
+
+
+def read_validators(cache_path: Path) -> dict[str, Validators]:
+    """
+    Read the HTTP validators recorded for a cache entry.
+
+    Returns:
+        Dict of {url: validators}, empty if none were recorded
+    """
+    try:
+        manifest = json.loads((cache_path / MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return {}
+    validators: dict[str, Validators] = manifest.get("validators", {})
+    return validators
+
+
+def freshness_check_due(cache_path: Path, ttl: float = FRESHNESS_CHECK_TTL) -> bool:
+    """
+    Check whether a cache entry is due to be checked against the server.
+
+    The manifest's mtime records the last download or check (see
+    mark_checked()), so entries are checked at most once per ttl seconds.
+    """
+    try:
+        return time.time() - (cache_path / MANIFEST_NAME).stat().st_mtime >= ttl
+    except OSError:
+        return False
+
+
+def mark_checked(cache_path: Path) -> None:
+    """Record that a cache entry was just found current on the server."""
+    try:
+        os.utime(cache_path / MANIFEST_NAME)
+    except OSError:
+        pass
+
+
+def response_validators(headers: Mapping[str, str]) -> Validators:
+    """Extract the ETag/Last-Modified validators from HTTP response headers."""
+    validators = {"etag": headers.get("etag"), "last_modified": headers.get("last-modified")}
+    return {k: v for k, v in validators.items() if v}
+
+
+def validators_match(stored: Validators, current: Validators) -> bool:
+    """
+    Check whether a cached download still matches the remote file.
+
+    ETags are compared when both sides have one, otherwise Last-Modified.
+    Without a common validator the cache is assumed to be current.
+    """
+    for key in ("etag", "last_modified"):
+        if key in stored and key in current:
+            return stored[key] == current[key]
+    return True
+
+
 def is_cached(uri: str) -> bool:
     """
     Check if data for a URI is already cached.
@@ -50,14 +263,14 @@ def is_cached(uri: str) -> bool:
         True if data exists in cache
     """
     cache_path = get_cached_path(uri)
-    if not cache_path.exists():
+    if (cache_path / MANIFEST_NAME).exists():
+        return True
+    if not cache_path.exists() or (cache_path / PARTIAL_NAME).exists():
         return False
 
-    # Check for shapefile or geojson (recursively for nested archives)
-    shapefiles = list(cache_path.rglob("*.shp"))
-    geojsons = list(cache_path.rglob("*.geojson"))
-
-    return len(shapefiles) > 0 or len(geojsons) > 0
+    # No manifest: look for any shapefile, geojson or parquet (recursively for
+    # nested archives), stopping at the first match
+    return next(iter_data_files(cache_path, DATA_SUFFIXES), None) is not None
 
 
 def clear_cache(uri: str | None = None) -> None:
@@ -9,16 +9,32 @@ Supported sources:
 Data licensing: Open Government Licence - Canada
 """
 
-import io
+import atexit
+import os
+import sys
+import tempfile
+import time
 import zipfile
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+from typing import IO, Any
 
 import httpx
 from rich.console import Console
 
-from .cache import get_cached_path, is_cached
+from .cache import (
+    entry_lock,
+    extract_archive,
+    get_cached_path,
+    is_cached,
+    iter_data_files,
+    mark_incomplete,
+    read_manifest,
+    write_manifest,
+)
 
-console = Console()
+console = Console(highlight=sys.stdout.isatty())
 
 # CanVec data URLs from Natural Resources Canada
 # CanVec is available at different scales: 1M, 250K, 50K
@@ -45,6 +61,15 @@ NHN_WORKUNITS = {
     "02OE000": "St-François River",
 }
 
+# NHN sublayers; "rivers" selects linear water instead of waterbodies
+_NHN_SUBLAYERS = frozenset({"rivers", "waterbody"})
+
+# Download URLs for the known workunits, built once
+NHN_URLS = {
+    workunit: NHN_URL_TEMPLATE.format(region=workunit[:2], workunit_lower=workunit.lower())
+    for workunit in NHN_WORKUNITS
+}
+
 # National Road Network (NRN) URLs by province
 # Statistics Canada NRN: https://www150.statcan.gc.ca/n1/pub/92-500-g/92-500-g2019001-eng.htm
 NRN_URLS = {
@@ -66,6 +91,8 @@ NRN_URLS = {
     "nu": "https://geo.statcan.gc.ca/nrn_rrn/nu/nrn_rrn_nu_SHAPE.zip",  # Nunavut
 }
 
+_NRN_VALID_MSG = ", ".join(NRN_URLS)
+
 # Province/territory names
 PROVINCE_NAMES = {
     "nl": "Newfoundland and Labrador",
@@ -84,6 +111,9 @@ PROVINCE_NAMES = {
 }
 
 # Size estimates in MB
+# Downloads up to this size (MB) are buffered in memory before extraction
+SPOOL_MAX_MB = 64
+
 SIZE_ESTIMATES = {
     "canvec:hydro": 150.0,
     "nrn:nl": 25.0,
@@ -111,7 +141,7 @@ SIZE_ESTIMATES = {
 }
 
 
-def parse_canada_uri(uri: str) -> dict:
+def parse_canada_uri(uri: str) -> dict[str, Any]:
     """
     Parse a Canada data URI into components.
 
@@ -121,12 +151,11 @@ def parse_canada_uri(uri: str) -> dict:
     Returns:
         Dict with source_type, province/layer, url, estimated_size_mb
     """
-    if not uri.startswith("canada:"):
+    # Check and strip the scheme in one pass
+    scheme, sep, path = uri.partition(":")
+    if scheme != "canada" or not sep:
         raise ValueError(f"Not a Canada URI: {uri}")
 
-    # Strip scheme
-    path = uri[7:]  # Remove "canada:"
-
     parts = path.split("/")
     if len(parts) < 2:
         raise ValueError(
@@ -159,7 +188,7 @@ def parse_canada_uri(uri: str) -> dict:
         if province not in NRN_URLS:
             raise ValueError(
                 f"Unknown NRN province: {province}\n"
-                f"Valid provinces: {', '.join(NRN_URLS.keys())}"
+                f"Valid provinces: {_NRN_VALID_MSG}"
             )
         url = NRN_URLS[province]
         size_mb = SIZE_ESTIMATES.get(f"nrn:{province}", 100.0)
@@ -172,13 +201,15 @@ def parse_canada_uri(uri: str) -> dict:
 
     elif source_type == "nhn":
         workunit = layer.upper()  # Workunits are uppercase like 02OJ000
-        region = workunit[:2]  # First 2 digits (e.g., "02")
-        workunit_lower = workunit.lower()  # Filename uses lowercase
-        url = NHN_URL_TEMPLATE.format(region=region, workunit_lower=workunit_lower)
+        if workunit in NHN_URLS:
+            url = NHN_URLS[workunit]
+        else:
+            # Region is the first 2 digits (e.g., "02"); filename uses lowercase
+            url = NHN_URL_TEMPLATE.format(region=workunit[:2], workunit_lower=workunit.lower())
         size_mb = SIZE_ESTIMATES.get(f"nhn:{workunit}", 10.0)
         description = NHN_WORKUNITS.get(workunit, f"NHN workunit {workunit}")
         # sublayer can be "rivers" to get linear water instead of waterbodies
-        nhn_layer = sublayer if sublayer in ("rivers", "waterbody") else "waterbody"
+        nhn_layer = sublayer if sublayer in _NHN_SUBLAYERS else "waterbody"
         return {
             "source_type": "nhn",
             "workunit": workunit,
@@ -195,7 +226,7 @@ def parse_canada_uri(uri: str) -> dict:
         )
 
 
-def estimate_canada_size(uri: str) -> dict:
+def estimate_canada_size(uri: str) -> dict[str, Any]:
     """
     Estimate download size for a Canada URI without downloading.
     """
@@ -212,6 +243,77 @@ def estimate_canada_size(uri: str) -> dict:
     }
 
 
+@lru_cache(maxsize=1)
+def _get_client() -> httpx.Client:
+    """
+    Get the shared HTTP client for Canadian downloads.
+
+    Reusing one client keeps connections (and TLS sessions) to the GC open
+    data hosts alive across retries and sources.
+    """
+    client = httpx.Client(
+        follow_redirects=True,
+        http2=True,
+        timeout=httpx.Timeout(60.0, connect=30.0, read=600.0),  # Long timeout for large files
+        limits=httpx.Limits(max_keepalive_connections=4),
+    )
+    atexit.register(client.close)
+    return client
+
+
+def _extract_members(archive_path: str, names: list[str], dest: Path) -> None:
+    """Extract a subset of archive members using a private ZipFile handle."""
+    with zipfile.ZipFile(archive_path) as zf:
+        extract_archive(zf, dest, names)
+
+
+def _extract_parallel(archive_path: str, names: list[str], dest: Path) -> None:
+    """
+    Extract a large archive with one worker per CPU.
+
+    Members are decompressed independently, and zlib releases the GIL, so
+    threads spread the work across cores.
+    """
+    workers = min(os.cpu_count() or 1, len(names))
+    if workers <= 1:
+        _extract_members(archive_path, names, dest)
+        return
+
+    # Create member directories up front so workers don't race on makedirs
+    for parent in {PurePosixPath(name).parent for name in names}:
+        if not parent.is_absolute() and ".." not in parent.parts:
+            (dest / parent).mkdir(parents=True, exist_ok=True)
+
+    chunks = [names[i::workers] for i in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_extract_members, archive_path, chunk, dest) for chunk in chunks]
+        for future in futures:
+            future.result()
+
+
+def _select_shapefile(shapefiles: list[Path], parsed: dict[str, Any]) -> str:
+    """Pick the shapefile a Canada URI refers to from an extracted archive."""
+    source_type = parsed["source_type"]
+
+    if source_type == "canvec":
+        target = "waterbody"
+    elif source_type == "nrn":
+        target = "roadseg"
+    elif source_type == "nhn":
+        # NHN has WATERBODY_2 (polygons) and SLWATER_1 (lines)
+        nhn_layer = parsed.get("nhn_layer", "waterbody")
+        target = "slwater" if nhn_layer == "rivers" else "waterbody"
+    else:
+        target = None
+
+    if target:
+        for shp in shapefiles:
+            if target in shp.stem.lower():
+                return str(shp)
+
+    return str(shapefiles[0])
+
+
 def fetch_canada(uri: str, force: bool = False) -> str:
     """
     Fetch Canadian open data.
@@ -223,88 +325,86 @@ def fetch_canada(uri: str, force: bool = False) -> str:
     Returns:
         Path to the downloaded shapefile (.shp)
     """
+    cache_path = get_cached_path(uri)
+    # Serialize fetches of this entry across processes; one that waited finds
+    # the finished entry in the cache check
+    with entry_lock(cache_path):
+        return _fetch_canada(uri, force=force)
+
+
+def _fetch_canada(uri: str, force: bool = False) -> str:
+    """Fetch Canada data while holding the entry lock (see fetch_canada)."""
     parsed = parse_canada_uri(uri)
-    source_type = parsed["source_type"]
     url = parsed["url"]
 
     cache_path = get_cached_path(uri)
 
     # Check cache first
-    if not force and is_cached(uri):
-        # Find any shapefile
-        shapefiles = list(cache_path.rglob("*.shp"))
+    if not force:
+        shapefiles = read_manifest(cache_path)
+        if shapefiles is None and is_cached(uri):
+            # Cached before manifests were written
+            shapefiles = list(iter_data_files(cache_path))
+            if shapefiles:
+                write_manifest(cache_path, shapefiles)
         if shapefiles:
             console.print(f"  [green]✓[/] {uri} [dim](cached)[/]")
-            # For CanVec hydro, return waterbody file
-            if source_type == "canvec":
-                for shp in shapefiles:
-                    if "waterbody" in shp.stem.lower():
-                        return str(shp)
-            # For NRN, return road segment file
-            elif source_type == "nrn":
-                for shp in shapefiles:
-                    if "roadseg" in shp.stem.lower():
-                        return str(shp)
-            # For NHN, return waterbody or slwater based on nhn_layer
-            elif source_type == "nhn":
-                nhn_layer = parsed.get("nhn_layer", "waterbody")
-                target = "slwater" if nhn_layer == "rivers" else "waterbody"
-                for shp in shapefiles:
-                    if target in shp.stem.lower():
-                        return str(shp)
-            return str(shapefiles[0])
+            return _select_shapefile(shapefiles, parsed)
 
     # Download the archive
     console.print(f"  [cyan]↓[/] Downloading {uri}...")
     console.print(f"      (this is a large file, please wait)")
 
     cache_path.mkdir(parents=True, exist_ok=True)
+    mark_incomplete(cache_path)
 
     max_retries = 3
-    timeout = httpx.Timeout(60.0, connect=30.0, read=600.0)  # Long timeout for large files
-
-    for attempt in range(max_retries):
-        try:
-            with httpx.Client(follow_redirects=True, timeout=timeout) as client:
-                response = client.get(url)
-                response.raise_for_status()
-            break
-        except httpx.HTTPError as e:
-            if attempt < max_retries - 1:
-                import time
-                console.print(f"  [yellow]Retry {attempt + 1}...[/]")
-                time.sleep(2 ** attempt)
-            else:
-                raise RuntimeError(f"Failed to download {url}: {e}")
 
-    # Extract the archive
-    with zipfile.ZipFile(io.BytesIO(response.content)) as zf:
-        zf.extractall(cache_path)
-
-    bytes_downloaded = len(response.content)
+    # Stream to a temp file instead of holding the archive in memory. Archives
+    # known to be large go straight to disk; small ones spill over if needed.
+    on_disk = parsed.get("estimated_size_mb", 0) > SPOOL_MAX_MB
+    archive: IO[bytes]
+    if on_disk:
+        archive = tempfile.NamedTemporaryFile(suffix=".zip")
+    else:
+        archive = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MB << 20)
+
+    try:
+        for attempt in range(max_retries):
+            try:
+                archive.seek(0)
+                archive.truncate()
+                with _get_client().stream("GET", url) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_bytes(1 << 20):
+                        archive.write(chunk)
+                break
+            except httpx.HTTPError as e:
+                if attempt < max_retries - 1:
+                    console.print(f"  [yellow]Retry {attempt + 1}...[/]")
+                    time.sleep(2 ** attempt)
+                else:
+                    raise RuntimeError(f"Failed to download {url}: {e}")
+
+        bytes_downloaded = archive.tell()
+
+        # Extract the archive, noting its shapefiles from the member list
+        archive.flush()
+        archive.seek(0)
+        with zipfile.ZipFile(archive) as zf:
+            names = zf.namelist()
+            if on_disk:
+                _extract_parallel(archive.name, names, cache_path)
+            else:
+                extract_archive(zf, cache_path)
+    finally:
+        archive.close()
 
-    # Find the appropriate shapefile
-    shapefiles = list(cache_path.rglob("*.shp"))
+    shapefiles = [cache_path / name for name in names if name.lower().endswith(".shp")]
     if not shapefiles:
         raise RuntimeError(f"No shapefile found in downloaded archive: {url}")
+    write_manifest(cache_path, shapefiles)
 
     console.print(f"  [green]✓[/] {uri} [dim]({bytes_downloaded / 1024 / 1024:.1f} MB)[/]")
 
-    # Return the most appropriate shapefile
-    if source_type == "canvec":
-        for shp in shapefiles:
-            if "waterbody" in shp.stem.lower():
-                return str(shp)
-    elif source_type == "nrn":
-        for shp in shapefiles:
-            if "roadseg" in shp.stem.lower():
-                return str(shp)
-    elif source_type == "nhn":
-        # NHN has WATERBODY_2 (polygons) and SLWATER_1 (lines)
-        nhn_layer = parsed.get("nhn_layer", "waterbody")
-        target = "slwater" if nhn_layer == "rivers" else "waterbody"
-        for shp in shapefiles:
-            if target in shp.stem.lower():
-                return str(shp)
-
-    return str(shapefiles[0])
+    return _select_shapefile(shapefiles, parsed)
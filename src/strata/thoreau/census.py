@@ -7,16 +7,50 @@ https://www2.census.gov/geo/tiger/TIGER{year}/{type}/tl_{year}_{fips}_{type}.zip
 State FIPS codes: VT=50, NY=36, NH=33, MA=25, ME=23
 """
 
-import io
+import asyncio
+import atexit
+import json
+import re
+import sys
+import tempfile
+import time
 import zipfile
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
+import geopandas as gpd
 import httpx
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import pyogrio
 from rich.console import Console
-
-from .cache import get_cached_path, is_cached
-
-console = Console()
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn
+
+from .cache import (
+    FRESHNESS_CHECK_TIMEOUT,
+    Validators,
+    entry_lock,
+    extract_archive,
+    freshness_check_due,
+    get_cached_path,
+    is_cached,
+    mark_checked,
+    mark_incomplete,
+    read_manifest,
+    read_validators,
+    response_validators,
+    validators_match,
+    write_manifest,
+)
+
+console = Console(highlight=sys.stdout.isatty())
+
+# Concurrent per-county downloads
+COUNTY_DOWNLOAD_WORKERS = 8
+
+TIGER_BASE_URL = "https://www2.census.gov/geo/tiger"
 
 # Approximate file sizes in MB for common TIGER datasets (2023)
 # These are estimates to help users understand download scale
@@ -77,7 +111,8 @@ TIGER_TYPES = {
     "tract": {"folder": "TRACT", "per_county": True, "national": False},
 }
 
-# County FIPS codes by state (we'll fetch the list dynamically or use known ones)
+# County FIPS codes by state, used when the TIGER directory index is unavailable
+# (see _county_fips)
 # Vermont counties (FIPS 50)
 VT_COUNTIES = [
     "001",  # Addison
@@ -130,7 +165,7 @@ STATE_COUNTIES = {
 }
 
 
-def parse_census_uri(uri: str) -> dict:
+def parse_census_uri(uri: str) -> dict[str, Any]:
     """
     Parse a census URI into components.
 
@@ -140,21 +175,30 @@ def parse_census_uri(uri: str) -> dict:
     Returns:
         Dict with year, state, type, fips, url(s), per_county flag
     """
-    if not uri.startswith("census:"):
-        raise ValueError(f"Not a census URI: {uri}")
+    # Parsing is pure, so results are memoized; copy so callers can't mutate the cache
+    parsed = _parse_census_uri(uri)
+    return {**parsed, "urls": list(parsed["urls"])}
+
 
-    # Strip scheme
-    path = uri[7:]  # Remove "census:"
+# census:tiger/{year}/{state}/{type}; rejects empty segments and trailing slashes
+_CENSUS_URI_RE = re.compile(
+    r"^census:tiger/(?P<year>\d{4})/(?P<state>[a-z]{2})/(?P<type>[a-z_]+)$", re.IGNORECASE
+)
 
-    # Expected format: tiger/{year}/{state}/{type}
-    parts = path.split("/")
-    if len(parts) != 4 or parts[0] != "tiger":
+
+@lru_cache(maxsize=256)
+def _parse_census_uri(uri: str) -> dict[str, Any]:
+    """Parse a census URI (cached; see parse_census_uri)."""
+    match = _CENSUS_URI_RE.match(uri)
+    if match is None:
+        if not uri.startswith("census:"):
+            raise ValueError(f"Not a census URI: {uri}")
         raise ValueError(
             f"Invalid census URI format: {uri}\n"
             "Expected: census:tiger/{year}/{state}/{type}"
         )
 
-    _, year, state, layer_type = parts
+    year, state, layer_type = match.group("year", "state", "type")
 
     state_lower = state.lower()
     if state_lower not in STATE_FIPS:
@@ -172,32 +216,23 @@ def parse_census_uri(uri: str) -> dict:
     per_county = type_info["per_county"]
     is_national = type_info.get("national", False)
 
-    # Build URL(s)
+    # Build URL(s); every TIGER file URL shares the same prefix and suffix
+    prefix = f"{TIGER_BASE_URL}/TIGER{year}/{tiger_folder}/tl_{year}_"
+    suffix = f"_{layer_type}.zip"
+    url: str | None
     if is_national:
         # National file (e.g., county, state) - single US-wide file
-        url = (
-            f"https://www2.census.gov/geo/tiger/TIGER{year}/{tiger_folder}/"
-            f"tl_{year}_us_{layer_type}.zip"
-        )
+        url = prefix + "us" + suffix
         urls = [url]
     elif per_county:
         # Per-county files - need to download multiple
         counties = STATE_COUNTIES.get(state_lower, [])
-        urls = []
-        for county_fips in counties:
-            full_fips = f"{fips}{county_fips}"
-            url = (
-                f"https://www2.census.gov/geo/tiger/TIGER{year}/{tiger_folder}/"
-                f"tl_{year}_{full_fips}_{layer_type}.zip"
-            )
-            urls.append(url)
+        state_prefix = prefix + fips
+        urls = [state_prefix + county_fips + suffix for county_fips in counties]
         url = urls[0] if urls else None  # Primary URL for display
     else:
         # Per-state file
-        url = (
-            f"https://www2.census.gov/geo/tiger/TIGER{year}/{tiger_folder}/"
-            f"tl_{year}_{fips}_{layer_type}.zip"
-        )
+        url = prefix + fips + suffix
         urls = [url]
 
     # Estimate file size
@@ -221,7 +256,7 @@ def parse_census_uri(uri: str) -> dict:
     }
 
 
-def estimate_census_size(uri: str) -> dict:
+def estimate_census_size(uri: str) -> dict[str, Any]:
     """
     Estimate download size for a Census URI without downloading.
 
@@ -235,71 +270,383 @@ def estimate_census_size(uri: str) -> dict:
     cached = is_cached(uri)
     cache_path = get_cached_path(uri)
 
+    urls = parsed["urls"]
+    if parsed["per_county"]:
+        # The same county list the download will use, without going online
+        counties = _county_fips(parsed, cache_path, fetch=False)
+        urls = [_county_url(parsed, county) for county in counties]
+
+    # Use the sizes seen by earlier downloads when every file has one,
+    # otherwise the table estimate
+    size_mb = parsed["estimated_size_mb"]
+    sizes = [size for url in urls if (size := _HEAD_SIZES.get(url)) is not None]
+    if urls and len(sizes) == len(urls):
+        size_mb = sum(sizes) / 1024 / 1024
+
     return {
         "uri": uri,
-        "estimated_size_mb": parsed["estimated_size_mb"],
+        "estimated_size_mb": size_mb,
         "cached": cached,
         "cache_path": str(cache_path),
-        "url": parsed["url"],
+        "url": urls[0] if urls else None,
     }
 
 
-def _download_single_file(url: str, cache_path: Path) -> int:
-    """Download a single file and extract to cache. Returns bytes downloaded."""
+@lru_cache(maxsize=1)
+def _get_client() -> httpx.Client:
+    """
+    Get the shared HTTP client for Census TIGER downloads.
+
+    Reusing one client keeps connections alive across retries and files;
+    the transport also retries failed connection attempts.
+    """
+    client = httpx.Client(
+        follow_redirects=True,
+        timeout=httpx.Timeout(30.0, connect=10.0, read=120.0),
+        transport=httpx.HTTPTransport(
+            http2=True,
+            retries=3,
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+        ),
+    )
+    atexit.register(client.close)
+    return client
+
+
+def _download_single_file(url: str, cache_path: Path, validators: dict[str, Validators]) -> int:
+    """
+    Download a single file and extract to cache. Returns bytes downloaded.
+
+    The response's HTTP validators are recorded in validators under url.
+    """
     max_retries = 3
-    timeout = httpx.Timeout(30.0, connect=10.0, read=120.0)
 
-    for attempt in range(max_retries):
+    # Stream to a temp file so the archive is never held in memory
+    with tempfile.TemporaryFile() as archive:
+        for attempt in range(max_retries):
+            try:
+                archive.seek(0)
+                archive.truncate()
+                with _get_client().stream("GET", url) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_bytes(1 << 20):
+                        archive.write(chunk)
+                validators[url] = response_validators(response.headers)
+                break
+            except httpx.HTTPError as e:
+                if attempt < max_retries - 1:
+                    time.sleep(2 ** attempt)
+                else:
+                    raise RuntimeError(f"Failed to download {url}: {e}")
+
+        bytes_downloaded = archive.tell()
+
+        archive.seek(0)
+        with zipfile.ZipFile(archive) as zf:
+            extract_archive(zf, cache_path)
+
+    return bytes_downloaded
+
+
+# Content-Length by URL, filled by _head_sizes when counties are downloaded
+_HEAD_SIZES: dict[str, int | None] = {}
+
+
+async def _head_all(
+    urls: list[str], client: httpx.AsyncClient | None = None
+) -> list[httpx.Headers | None]:
+    """
+    Issue concurrent HEAD requests and return each URL's response headers.
+
+    Headers are None for URLs that couldn't be reached.
+    """
+    async def head(client: httpx.AsyncClient, url: str) -> httpx.Headers | None:
         try:
-            with httpx.Client(follow_redirects=True, timeout=timeout) as client:
-                response = client.get(url)
-                response.raise_for_status()
-            break
-        except httpx.HTTPError as e:
-            if attempt < max_retries - 1:
-                import time
-                time.sleep(2 ** attempt)
-            else:
-                raise RuntimeError(f"Failed to download {url}: {e}")
+            response = await client.head(url)
+            response.raise_for_status()
+            return response.headers
+        except httpx.HTTPError:
+            return None
+
+    if client is not None:
+        return await asyncio.gather(*(head(client, url) for url in urls))
+
+    async with httpx.AsyncClient(follow_redirects=True, http2=True, timeout=10.0) as client:
+        return await asyncio.gather(*(head(client, url) for url in urls))
+
+
+async def _head_sizes(urls: list[str], client: httpx.AsyncClient | None = None) -> list[int | None]:
+    """
+    Get the Content-Length of each URL with concurrent HEAD requests.
+
+    Results are memoized per URL; sizes that can't be determined are None.
+    """
+    missing = [url for url in urls if url not in _HEAD_SIZES]
+    if missing:
+        for url, headers in zip(missing, await _head_all(missing, client)):
+            try:
+                _HEAD_SIZES[url] = int(headers["content-length"]) if headers else None
+            except (KeyError, ValueError):
+                _HEAD_SIZES[url] = None
+    return [_HEAD_SIZES[url] for url in urls]
+
 
-    with zipfile.ZipFile(io.BytesIO(response.content)) as zf:
-        zf.extractall(cache_path)
+def _is_stale(cache_path: Path) -> bool:
+    """
+    Check a cache entry's recorded downloads against the server.
 
-    return len(response.content)
+    Runs at most once per FRESHNESS_CHECK_TTL for an entry. Network errors
+    and entries without validators count as current, so working offline
+    never invalidates the cache.
+    """
+    if not freshness_check_due(cache_path):
+        return False
+
+    for url, stored in read_validators(cache_path).items():
+        try:
+            response = _get_client().head(url, timeout=FRESHNESS_CHECK_TIMEOUT)
+            response.raise_for_status()
+        except httpx.HTTPError:
+            return False
+        if not validators_match(stored, response_validators(response.headers)):
+            return True
+    mark_checked(cache_path)
+    return False
+
+
+async def _download_single_async(
+    client: httpx.AsyncClient, url: str, cache_path: Path, validators: dict[str, Validators]
+) -> int:
+    """
+    Download a single file and extract to cache. Returns bytes downloaded.
+
+    The response's HTTP validators are recorded in validators under url.
+    """
+    max_retries = 3
+    cache_path.mkdir(parents=True, exist_ok=True)
+
+    # Stream to a temp file so the archive is never held in memory
+    with tempfile.TemporaryFile() as archive:
+        for attempt in range(max_retries):
+            try:
+                archive.seek(0)
+                archive.truncate()
+                async with client.stream("GET", url) as response:
+                    response.raise_for_status()
+                    async for chunk in response.aiter_bytes(1 << 20):
+                        archive.write(chunk)
+                validators[url] = response_validators(response.headers)
+                break
+            except httpx.HTTPError as e:
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(2 ** attempt)
+                else:
+                    raise RuntimeError(f"Failed to download {url}: {e}")
+
+        bytes_downloaded = archive.tell()
+
+        archive.seek(0)
+        with zipfile.ZipFile(archive) as zf:
+            extract_archive(zf, cache_path)
+
+    return bytes_downloaded
+
+
+async def _download_counties(
+    urls: list[str], cache_path: Path, validators: dict[str, Validators]
+) -> list[int | BaseException]:
+    """
+    Download per-county files concurrently into county_NNN subdirectories.
+
+    Each download's HTTP validators are recorded in validators.
+
+    Progress is shown as a single bar advanced as each county finishes.
+
+    Returns bytes downloaded (or the exception raised) for each URL, in order.
+    """
+    # Capped to stay polite to census.gov
+    semaphore = asyncio.Semaphore(COUNTY_DOWNLOAD_WORKERS)
+    limits = httpx.Limits(
+        max_keepalive_connections=COUNTY_DOWNLOAD_WORKERS,
+        max_connections=COUNTY_DOWNLOAD_WORKERS,
+    )
+
+    async with httpx.AsyncClient(
+        follow_redirects=True,
+        http2=True,
+        timeout=httpx.Timeout(30.0, connect=10.0, read=120.0),
+        limits=limits,
+    ) as client:
+
+        with Progress(
+            TextColumn("      counties"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            console=console,
+            transient=True,
+            disable=not console.is_terminal,
+        ) as progress:
+            task = progress.add_task("counties", total=len(urls))
+
+            async def download(i: int, url: str) -> int:
+                async with semaphore:
+                    try:
+                        return await _download_single_async(
+                            client, url, cache_path / f"county_{i:03d}", validators
+                        )
+                    finally:
+                        progress.advance(task)
+
+            # Start the largest files first so a big county doesn't finish last
+            # on its own; results stay in county order
+            sizes = await _head_sizes(urls, client)
+            order = sorted(range(len(urls)), key=lambda i: sizes[i] or 0, reverse=True)
+            tasks = {i: asyncio.ensure_future(download(i, urls[i])) for i in order}
+
+            return await asyncio.gather(
+                *(tasks[i] for i in range(len(urls))),
+                return_exceptions=True,
+            )
+
+
+def _county_url(parsed: dict[str, Any], county_fips: str) -> str:
+    """Build the TIGER download URL for one county of a parsed per-county URI."""
+    year, layer_type = parsed["year"], parsed["type"]
+    folder = TIGER_TYPES[layer_type]["folder"]
+    filename = f"tl_{year}_{parsed['fips']}{county_fips}_{layer_type}.zip"
+    return f"{TIGER_BASE_URL}/TIGER{year}/{folder}/{filename}"
+
+
+def _county_fips(
+    parsed: dict[str, Any], cache_path: Path, force: bool = False, fetch: bool = True
+) -> list[str]:
+    """
+    List the counties of a state that have files for a per-county TIGER type.
+
+    One GET of the TIGER folder's directory index replaces the hand-curated
+    STATE_COUNTIES table, so states missing from it work and counties
+    without a file are never requested. The list is cached next to the
+    data; if the index can't be fetched or parsed, STATE_COUNTIES is used.
+    With fetch=False the server is never contacted: the cached list or
+    STATE_COUNTIES is returned.
+    """
+    state = parsed["state"]
+    list_path = cache_path / f"counties_{state}.json"
+    if not force:
+        try:
+            counties: list[str] = json.loads(list_path.read_text())
+            return counties
+        except (OSError, ValueError):
+            pass
+    if not fetch:
+        return STATE_COUNTIES.get(state, [])
+
+    year, layer_type = parsed["year"], parsed["type"]
+    folder = TIGER_TYPES[layer_type]["folder"]
+    try:
+        response = _get_client().get(f"{TIGER_BASE_URL}/TIGER{year}/{folder}/")
+        response.raise_for_status()
+    except httpx.HTTPError:
+        return STATE_COUNTIES.get(state, [])
+
+    pattern = re.compile(rf"tl_{year}_{parsed['fips']}(\d{{3}})_{layer_type}\.zip")
+    counties = sorted(set(pattern.findall(response.text)))
+    if not counties:
+        return STATE_COUNTIES.get(state, [])
+
+    list_path.write_text(json.dumps(counties))
+    return counties
+
+
+def _find_cached_output(cache_path: Path) -> Path | None:
+    """Find the output file in a cache entry that has no manifest."""
+    # Merged per-county data, then filtered national data (GeoParquet, or
+    # shapefiles from older caches)
+    for name in ("merged.parquet", "filtered.parquet", "merged.shp", "filtered.shp"):
+        if (cache_path / name).exists():
+            return cache_path / name
+    # Regular per-state files
+    return next(cache_path.glob("*.shp"), None)
+
+
+def _geo_metadata(gdf: gpd.GeoDataFrame) -> bytes:
+    """Build the GeoParquet "geo" schema metadata for a GeoDataFrame's geometry."""
+    column = {"encoding": "WKB", "geometry_types": []}
+    if gdf.crs is not None:
+        column["crs"] = gdf.crs.to_json_dict()
+    return json.dumps(
+        {
+            "version": "1.0.0",
+            "primary_column": gdf.geometry.name,
+            "columns": {gdf.geometry.name: column},
+        }
+    ).encode()
+
+
+def _merge_parquet(parts: list[Path], merged_path: Path, geo: bytes) -> int:
+    """
+    Merge Parquet parts into one GeoParquet file, one row group per part.
+
+    Parts may have different columns: the merged schema is the union of
+    theirs, and a part's missing columns are filled with nulls.
+
+    Returns:
+        Number of rows written
+    """
+    schema = pa.unify_schemas(
+        [pq.read_schema(part) for part in parts], promote_options="permissive"
+    ).with_metadata({b"geo": geo})
+    dataset = ds.dataset(parts, schema=schema, format="parquet")
+
+    rows = 0
+    with pq.ParquetWriter(merged_path, schema, compression="zstd") as writer:
+        for fragment in dataset.get_fragments():
+            table = fragment.to_table(schema=schema)
+            writer.write_table(table)
+            rows += len(table)
+    return rows
 
 
 def fetch_census(uri: str, force: bool = False) -> str:
     """
-    Fetch Census TIGER data and return path to shapefile.
+    Fetch Census TIGER data and return path to the data file.
 
     For per-county data (areawater, linearwater), downloads all county
-    files and merges them into a single shapefile.
+    files and merges them into a single GeoParquet file. National files are
+    filtered to the state and also stored as GeoParquet.
 
     Args:
         uri: Census URI like "census:tiger/2023/vt/cousub"
         force: Re-download even if cached
 
     Returns:
-        Path to the downloaded/merged shapefile (.shp)
+        Path to the downloaded shapefile (.shp) or merged/filtered GeoParquet
+        file (.parquet)
     """
-    # Check cache first
-    if not force and is_cached(uri):
-        cache_path = get_cached_path(uri)
-        # For merged per-county data, look for merged.shp
-        merged = cache_path / "merged.shp"
-        if merged.exists():
-            console.print(f"  [green]✓[/] {uri} [dim](cached)[/]")
-            return str(merged)
-        # For filtered national data, look for filtered.shp
-        filtered = cache_path / "filtered.shp"
-        if filtered.exists():
-            console.print(f"  [green]✓[/] {uri} [dim](cached)[/]")
-            return str(filtered)
-        # For regular per-state files
-        shapefiles = list(cache_path.glob("*.shp"))
+    cache_path = get_cached_path(uri)
+    # Serialize fetches of this entry across processes; one that waited finds
+    # the finished entry in the cache check
+    with entry_lock(cache_path):
+        return _fetch_census(uri, force=force)
+
+
+def _fetch_census(uri: str, force: bool = False) -> str:
+    """Fetch Census data while holding the entry lock (see fetch_census)."""
+    # Check cache first; the manifest records the finished output
+    cache_path = get_cached_path(uri)
+    if not force:
+        shapefiles = read_manifest(cache_path)
+        if shapefiles is None and is_cached(uri):
+            # Cached before manifests were written
+            output = _find_cached_output(cache_path)
+            if output:
+                shapefiles = [output]
+                write_manifest(cache_path, shapefiles)
         if shapefiles:
-            console.print(f"  [green]✓[/] {uri} [dim](cached)[/]")
-            return str(shapefiles[0])
+            if not _is_stale(cache_path):
+                console.print(f"  [green]✓[/] {uri} [dim](cached)[/]")
+                return str(shapefiles[0])
+            console.print(f"  [yellow]↻[/] {uri} changed upstream, re-downloading")
 
     # Parse URI to get URL(s)
     parsed = parse_census_uri(uri)
@@ -308,41 +655,61 @@ def fetch_census(uri: str, force: bool = False) -> str:
     is_national = parsed.get("national", False)
     state_fips = parsed["fips"]
 
-    cache_path = get_cached_path(uri)
     cache_path.mkdir(parents=True, exist_ok=True)
+    mark_incomplete(cache_path)
+
+    # HTTP validators of this fetch's downloads, by URL, for the manifest
+    validators: dict[str, Validators] = {}
+
+    if per_county:
+        # Only request the counties the server actually has files for
+        urls = [_county_url(parsed, county) for county in _county_fips(parsed, cache_path, force)]
+        if not urls:
+            raise RuntimeError(f"No county files found for {uri}")
 
     if is_national:
         # National file - download once and filter by state FIPS
         url = urls[0]
         console.print(f"  [cyan]↓[/] Downloading {uri} (national file, filtering to state)...")
 
-        bytes_downloaded = _download_single_file(url, cache_path)
+        bytes_downloaded = _download_single_file(url, cache_path, validators)
 
         # Find the shapefile and filter by state
         shapefiles = list(cache_path.glob("*.shp"))
         if not shapefiles:
             raise RuntimeError(f"No shapefile found in downloaded archive: {url}")
 
-        import geopandas as gpd
-
-        gdf = gpd.read_file(shapefiles[0])
-
-        # Filter by state FIPS (STATEFP column)
-        if "STATEFP" in gdf.columns:
-            state_gdf = gdf[gdf["STATEFP"] == state_fips].copy()
-        elif "STATEFP20" in gdf.columns:
-            state_gdf = gdf[gdf["STATEFP20"] == state_fips].copy()
-        else:
+        # Filter by state FIPS inside GDAL so other states are never loaded
+        fields = set(pyogrio.read_info(shapefiles[0])["fields"])
+        column: str | None
+        where: str | None
+        if "STATEFP" in fields:
+            column = "STATEFP"
+            where = f"STATEFP = '{state_fips}'"
+        elif "STATEFP20" in fields:
+            column = "STATEFP20"
+            where = f"STATEFP20 = '{state_fips}'"
+        elif "GEOID" in fields:
             # Try to infer from GEOID
-            if "GEOID" in gdf.columns:
-                state_gdf = gdf[gdf["GEOID"].str.startswith(state_fips)].copy()
-            else:
-                console.print(f"  [yellow]Warning: Could not filter national file by state[/]")
-                state_gdf = gdf
+            column = "GEOID"
+            where = f"GEOID LIKE '{state_fips}%'"
+        else:
+            console.print(f"  [yellow]Warning: Could not filter national file by state[/]")
+            column = where = None
+
+        try:
+            state_gdf = gpd.read_file(shapefiles[0], engine="pyogrio", use_arrow=True, where=where)
+        except ValueError:
+            # Driver rejected the filter; load everything and filter in memory
+            state_gdf = gpd.read_file(shapefiles[0], engine="pyogrio", use_arrow=True)
+            if column is not None:
+                state_gdf = state_gdf[state_gdf[column].str.startswith(state_fips)]
 
         # Save filtered file
-        filtered_path = cache_path / "filtered.shp"
-        state_gdf.to_file(filtered_path)
+        filtered_path = cache_path / "filtered.parquet"
+        state_gdf.to_parquet(filtered_path, compression="zstd", schema_version="1.0.0")
+
+        write_manifest(cache_path, [filtered_path], validators)
 
         console.print(f"  [green]✓[/] {uri} [dim]({bytes_downloaded / 1024 / 1024:.1f} MB, {len(state_gdf)} features)[/]")
         return str(filtered_path)
@@ -351,45 +718,64 @@ def fetch_census(uri: str, force: bool = False) -> str:
         # Download multiple county files and merge
         console.print(f"  [cyan]↓[/] Downloading {uri} ({len(urls)} counties)...")
 
+        # Downloads are network-bound, so fetch counties concurrently on one
+        # event loop; shapefiles are then read in county order
+        results = asyncio.run(_download_counties(urls, cache_path, validators))
+
+        # Stage each county as its own GeoParquet part so only one county is held
+        # in memory at a time; parts are merged once every county's schema is known
+        merged_path = cache_path / "merged.parquet"
         total_bytes = 0
-        all_gdfs = []
+        parts = []
+        geo = None
+        skipped = []
 
-        for i, url in enumerate(urls):
+        for i, result in enumerate(results):
             county_dir = cache_path / f"county_{i:03d}"
-            county_dir.mkdir(parents=True, exist_ok=True)
 
             try:
-                bytes_downloaded = _download_single_file(url, county_dir)
-                total_bytes += bytes_downloaded
+                if isinstance(result, BaseException):
+                    raise result
+                total_bytes += result
 
                 # Load the shapefile
                 shapefiles = list(county_dir.glob("*.shp"))
-                if shapefiles:
-                    import geopandas as gpd
-                    gdf = gpd.read_file(shapefiles[0])
-                    all_gdfs.append(gdf)
+                if not shapefiles:
+                    continue
+                gdf = gpd.read_file(shapefiles[0], engine="pyogrio", use_arrow=True)
             except Exception as e:
                 # Some counties might not have data, skip them
-                console.print(f"  [dim]Skipped county {i+1}: {e}[/]")
+                skipped.append(f"  [dim]Skipped county {i+1}: {e}[/]")
                 continue
 
-        if not all_gdfs:
-            raise RuntimeError(f"No data found for {uri}")
+            part = county_dir / "county.parquet"
+            pq.write_table(pa.table(gdf.to_arrow(index=False, geometry_encoding="WKB")), part)
+            parts.append(part)
+            if geo is None:
+                geo = _geo_metadata(gdf)
 
-        # Merge all county data
-        import pandas as pd
-        import geopandas as gpd
+        if skipped:
+            console.print("\n".join(skipped))
 
-        merged_gdf = gpd.GeoDataFrame(
-            pd.concat(all_gdfs, ignore_index=True),
-            crs=all_gdfs[0].crs
-        )
-
-        # Save merged file
-        merged_path = cache_path / "merged.shp"
-        merged_gdf.to_file(merged_path)
+        if not parts or geo is None:
+            raise RuntimeError(f"No data found for {uri}")
 
-        console.print(f"  [green]✓[/] {uri} [dim]({total_bytes / 1024 / 1024:.1f} MB, {len(merged_gdf)} features)[/]")
+        try:
+            total_features = _merge_parquet(parts, merged_path, geo)
+        except Exception:
+            # Don't leave a partial merge behind to be picked up as cached
+            merged_path.unlink(missing_ok=True)
+            raise
+        finally:
+            for part in parts:
+                part.unlink(missing_ok=True)
+
+        write_manifest(cache_path, [merged_path], validators)
+
+        console.print(
+            f"  [green]✓[/] {uri} "
+            f"[dim]({total_bytes / 1024 / 1024:.1f} MB, {total_features} features)[/]"
+        )
         return str(merged_path)
 
     else:
@@ -397,12 +783,14 @@ def fetch_census(uri: str, force: bool = False) -> str:
         url = urls[0]
         console.print(f"  [cyan]↓[/] Downloading {uri}...")
 
-        bytes_downloaded = _download_single_file(url, cache_path)
+        bytes_downloaded = _download_single_file(url, cache_path, validators)
 
         # Find the shapefile
         shapefiles = list(cache_path.glob("*.shp"))
         if not shapefiles:
             raise RuntimeError(f"No shapefile found in downloaded archive: {url}")
 
+        write_manifest(cache_path, shapefiles[:1], validators)
+
         console.print(f"  [green]✓[/] {uri} [dim]({bytes_downloaded / 1024 / 1024:.1f} MB)[/]")
         return str(shapefiles[0])
@@ -8,16 +8,37 @@ Data source: https://www.donneesquebec.ca/recherche/dataset/decoupages-administr
 License: CC-BY 4.0
 """
 
-import io
+import atexit
+import re
+import sys
+import tempfile
+import time
 import zipfile
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 import httpx
 from rich.console import Console
 
-from .cache import get_cached_path, is_cached
-
-console = Console()
+from .cache import (
+    FRESHNESS_CHECK_TIMEOUT,
+    entry_lock,
+    extract_archive,
+    freshness_check_due,
+    get_cached_path,
+    is_cached,
+    iter_data_files,
+    mark_checked,
+    mark_incomplete,
+    read_manifest,
+    read_validators,
+    response_validators,
+    validators_match,
+    write_manifest,
+)
+
+console = Console(highlight=sys.stdout.isatty())
 
 # Quebec data URLs from MERN
 QUEBEC_URLS = {
@@ -51,7 +72,7 @@ QUEBEC_LAYERS = {
 }
 
 
-def parse_quebec_uri(uri: str) -> dict:
+def parse_quebec_uri(uri: str) -> dict[str, Any]:
     """
     Parse a Quebec data URI into components.
 
@@ -61,14 +82,27 @@ def parse_quebec_uri(uri: str) -> dict:
     Returns:
         Dict with layer, url, estimated_size_mb
     """
-    if not uri.startswith("quebec:"):
-        raise ValueError(f"Not a Quebec URI: {uri}")
+    # Parsing is pure, so results are memoized; copy so callers can't mutate the cache
+    return dict(_parse_quebec_uri(uri))
+
+
+_QUEBEC_URI_RE = re.compile(r"^quebec:(?P<layer>[a-z0-9_]+)$", re.IGNORECASE)
+
 
-    # Strip scheme
-    path = uri[7:]  # Remove "quebec:"
+@lru_cache(maxsize=256)
+def _parse_quebec_uri(uri: str) -> dict[str, Any]:
+    """Parse a Quebec URI (cached; see parse_quebec_uri)."""
+    match = _QUEBEC_URI_RE.match(uri)
+    if match is None:
+        if not uri.startswith("quebec:"):
+            raise ValueError(f"Not a Quebec URI: {uri}")
+        raise ValueError(
+            f"Unknown Quebec layer: {uri.partition(':')[2]}\n"
+            f"Valid layers: {', '.join(QUEBEC_LAYERS.keys())}"
+        )
 
     # Handle simple layer names
-    layer = path.lower()
+    layer = match["layer"].lower()
 
     # Map layer names to data source
     if layer in ("municipalities", "mrc", "regions", "metropolitan"):
@@ -95,7 +129,7 @@ def parse_quebec_uri(uri: str) -> dict:
     }
 
 
-def estimate_quebec_size(uri: str) -> dict:
+def estimate_quebec_size(uri: str) -> dict[str, Any]:
     """
     Estimate download size for a Quebec URI without downloading.
 
@@ -118,6 +152,51 @@ def estimate_quebec_size(uri: str) -> dict:
     }
 
 
+@lru_cache(maxsize=1)
+def _get_client() -> httpx.Client:
+    """
+    Get the shared HTTP client for Quebec downloads.
+
+    Reusing one client keeps connections alive across retries and files;
+    the transport also retries failed connection attempts.
+    """
+    client = httpx.Client(
+        follow_redirects=True,
+        # Longer read timeout for large files
+        timeout=httpx.Timeout(30.0, connect=10.0, read=300.0),
+        transport=httpx.HTTPTransport(
+            http2=True,
+            retries=3,
+            limits=httpx.Limits(max_keepalive_connections=4),
+        ),
+    )
+    atexit.register(client.close)
+    return client
+
+
+def _is_stale(cache_path: Path) -> bool:
+    """
+    Check a cache entry's recorded download against the server.
+
+    Runs at most once per FRESHNESS_CHECK_TTL for an entry. Network errors
+    and entries without validators count as current, so working offline
+    never invalidates the cache.
+    """
+    if not freshness_check_due(cache_path):
+        return False
+
+    for url, stored in read_validators(cache_path).items():
+        try:
+            response = _get_client().head(url, timeout=FRESHNESS_CHECK_TIMEOUT)
+            response.raise_for_status()
+        except httpx.HTTPError:
+            return False
+        if not validators_match(stored, response_validators(response.headers)):
+            return True
+    mark_checked(cache_path)
+    return False
+
+
 def fetch_quebec(uri: str, force: bool = False) -> str:
     """
     Fetch Quebec administrative boundary data.
@@ -129,6 +208,15 @@ def fetch_quebec(uri: str, force: bool = False) -> str:
     Returns:
         Path to the downloaded shapefile (.shp)
     """
+    cache_path = get_cached_path(f"quebec:{parse_quebec_uri(uri)['source']}")
+    # Serialize fetches of this entry across processes; one that waited finds
+    # the finished entry in the cache check
+    with entry_lock(cache_path):
+        return _fetch_quebec(uri, force=force)
+
+
+def _fetch_quebec(uri: str, force: bool = False) -> str:
+    """Fetch Quebec data while holding the entry lock (see fetch_quebec)."""
     parsed = parse_quebec_uri(uri)
     layer = parsed["layer"]
     source = parsed["source"]
@@ -139,54 +227,70 @@ def fetch_quebec(uri: str, force: bool = False) -> str:
     cache_uri = f"quebec:{source}"
     cache_path = get_cached_path(cache_uri)
 
-    # Check cache first
-    if not force and is_cached(cache_uri):
+    # Check cache first; the manifest lists every shapefile in the archive
+    if not force:
+        shapefiles = read_manifest(cache_path)
+        if shapefiles is None and is_cached(cache_uri):
+            # Cached before manifests were written
+            shapefiles = list(iter_data_files(cache_path))
+            if shapefiles:
+                write_manifest(cache_path, shapefiles)
         # Find the requested layer shapefile
-        shapefiles = list(cache_path.rglob(f"{shapefile_prefix}*.shp"))
-        if shapefiles:
-            console.print(f"  [green]✓[/] {uri} [dim](cached)[/]")
-            return str(shapefiles[0])
+        match = next(
+            (shp for shp in shapefiles or [] if shp.stem.startswith(shapefile_prefix)), None
+        )
+        if match:
+            if not _is_stale(cache_path):
+                console.print(f"  [green]✓[/] {uri} [dim](cached)[/]")
+                return str(match)
+            console.print(f"  [yellow]↻[/] {uri} changed upstream, re-downloading")
 
     # Download the archive
     console.print(f"  [cyan]↓[/] Downloading {uri}...")
 
     cache_path.mkdir(parents=True, exist_ok=True)
+    mark_incomplete(cache_path)
 
     max_retries = 3
-    timeout = httpx.Timeout(30.0, connect=10.0, read=300.0)  # Longer read timeout for large files
-
-    for attempt in range(max_retries):
-        try:
-            with httpx.Client(follow_redirects=True, timeout=timeout) as client:
-                response = client.get(url)
-                response.raise_for_status()
-            break
-        except httpx.HTTPError as e:
-            if attempt < max_retries - 1:
-                import time
-                console.print(f"  [yellow]Retry {attempt + 1}...[/]")
-                time.sleep(2 ** attempt)
-            else:
-                raise RuntimeError(f"Failed to download {url}: {e}")
-
-    # Extract the archive
-    with zipfile.ZipFile(io.BytesIO(response.content)) as zf:
-        zf.extractall(cache_path)
-
-    bytes_downloaded = len(response.content)
-
-    # Find the requested layer shapefile
-    shapefiles = list(cache_path.rglob(f"{shapefile_prefix}*.shp"))
-    if not shapefiles:
-        # Try any shapefile
-        shapefiles = list(cache_path.rglob("*.shp"))
 
+    # Stream to a temp file so the archive is never held in memory
+    with tempfile.TemporaryFile() as archive:
+        for attempt in range(max_retries):
+            try:
+                archive.seek(0)
+                archive.truncate()
+                with _get_client().stream("GET", url) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_bytes(1 << 20):
+                        archive.write(chunk)
+                validators = response_validators(response.headers)
+                break
+            except httpx.HTTPError as e:
+                if attempt < max_retries - 1:
+                    console.print(f"  [yellow]Retry {attempt + 1}...[/]")
+                    time.sleep(2 ** attempt)
+                else:
+                    raise RuntimeError(f"Failed to download {url}: {e}")
+
+        bytes_downloaded = archive.tell()
+
+        # Extract the archive, noting its shapefiles from the member list
+        archive.seek(0)
+        with zipfile.ZipFile(archive) as zf:
+            names = zf.namelist()
+            extract_archive(zf, cache_path)
+
+    shapefiles = [cache_path / name for name in names if name.lower().endswith(".shp")]
     if not shapefiles:
         raise RuntimeError(f"No shapefile found in downloaded archive: {url}")
+    write_manifest(cache_path, shapefiles, {url: validators} if validators else None)
 
     console.print(f"  [green]✓[/] {uri} [dim]({bytes_downloaded / 1024 / 1024:.1f} MB)[/]")
 
     # Return the matching shapefile
+    for shp in shapefiles:
+        if shp.stem.startswith(shapefile_prefix):
+            return str(shp)
     for shp in shapefiles:
         if shapefile_prefix in shp.stem:
             return str(shp)
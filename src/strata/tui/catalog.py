@@ -8,137 +8,181 @@ Provides a browsable catalog of available data sources including:
 """
 
 from dataclasses import dataclass
+from functools import cache, lru_cache
+from typing import Any, NamedTuple
 
-# US State metadata
-US_STATES = {
-    "al": {"name": "Alabama", "fips": "01"},
-    "ak": {"name": "Alaska", "fips": "02"},
-    "az": {"name": "Arizona", "fips": "04"},
-    "ar": {"name": "Arkansas", "fips": "05"},
-    "ca": {"name": "California", "fips": "06"},
-    "co": {"name": "Colorado", "fips": "08"},
-    "ct": {"name": "Connecticut", "fips": "09"},
-    "de": {"name": "Delaware", "fips": "10"},
-    "dc": {"name": "District of Columbia", "fips": "11"},
-    "fl": {"name": "Florida", "fips": "12"},
-    "ga": {"name": "Georgia", "fips": "13"},
-    "hi": {"name": "Hawaii", "fips": "15"},
-    "id": {"name": "Idaho", "fips": "16"},
-    "il": {"name": "Illinois", "fips": "17"},
-    "in": {"name": "Indiana", "fips": "18"},
-    "ia": {"name": "Iowa", "fips": "19"},
-    "ks": {"name": "Kansas", "fips": "20"},
-    "ky": {"name": "Kentucky", "fips": "21"},
-    "la": {"name": "Louisiana", "fips": "22"},
-    "me": {"name": "Maine", "fips": "23"},
-    "md": {"name": "Maryland", "fips": "24"},
-    "ma": {"name": "Massachusetts", "fips": "25"},
-    "mi": {"name": "Michigan", "fips": "26"},
-    "mn": {"name": "Minnesota", "fips": "27"},
-    "ms": {"name": "Mississippi", "fips": "28"},
-    "mo": {"name": "Missouri", "fips": "29"},
-    "mt": {"name": "Montana", "fips": "30"},
-    "ne": {"name": "Nebraska", "fips": "31"},
-    "nv": {"name": "Nevada", "fips": "32"},
-    "nh": {"name": "New Hampshire", "fips": "33"},
-    "nj": {"name": "New Jersey", "fips": "34"},
-    "nm": {"name": "New Mexico", "fips": "35"},
-    "ny": {"name": "New York", "fips": "36"},
-    "nc": {"name": "North Carolina", "fips": "37"},
-    "nd": {"name": "North Dakota", "fips": "38"},
-    "oh": {"name": "Ohio", "fips": "39"},
-    "ok": {"name": "Oklahoma", "fips": "40"},
-    "or": {"name": "Oregon", "fips": "41"},
-    "pa": {"name": "Pennsylvania", "fips": "42"},
-    "ri": {"name": "Rhode Island", "fips": "44"},
-    "sc": {"name": "South Carolina", "fips": "45"},
-    "sd": {"name": "South Dakota", "fips": "46"},
-    "tn": {"name": "Tennessee", "fips": "47"},
-    "tx": {"name": "Texas", "fips": "48"},
-    "ut": {"name": "Utah", "fips": "49"},
-    "vt": {"name": "Vermont", "fips": "50"},
-    "va": {"name": "Virginia", "fips": "51"},
-    "wa": {"name": "Washington", "fips": "53"},
-    "wv": {"name": "West Virginia", "fips": "54"},
-    "wi": {"name": "Wisconsin", "fips": "55"},
-    "wy": {"name": "Wyoming", "fips": "56"},
-    "pr": {"name": "Puerto Rico", "fips": "72"},
+import numpy as np
+
+
+class StateRow(NamedTuple):
+    """A US state or territory."""
+
+    code: str
+    name: str
+    fips: str
+
+
+class LayerRow(NamedTuple):
+    """A data layer offered for a source."""
+
+    code: str
+    name: str
+    description: str
+    geometry: str  # polygon, line, point
+    features: str | None = None  # Approximate feature count, if known
+
+
+# US State metadata, keyed by postal code
+US_STATES: dict[str, StateRow] = {
+    "al": StateRow("al", "Alabama", "01"),
+    "ak": StateRow("ak", "Alaska", "02"),
+    "az": StateRow("az", "Arizona", "04"),
+    "ar": StateRow("ar", "Arkansas", "05"),
+    "ca": StateRow("ca", "California", "06"),
+    "co": StateRow("co", "Colorado", "08"),
+    "ct": StateRow("ct", "Connecticut", "09"),
+    "de": StateRow("de", "Delaware", "10"),
+    "dc": StateRow("dc", "District of Columbia", "11"),
+    "fl": StateRow("fl", "Florida", "12"),
+    "ga": StateRow("ga", "Georgia", "13"),
+    "hi": StateRow("hi", "Hawaii", "15"),
+    "id": StateRow("id", "Idaho", "16"),
+    "il": StateRow("il", "Illinois", "17"),
+    "in": StateRow("in", "Indiana", "18"),
+    "ia": StateRow("ia", "Iowa", "19"),
+    "ks": StateRow("ks", "Kansas", "20"),
+    "ky": StateRow("ky", "Kentucky", "21"),
+    "la": StateRow("la", "Louisiana", "22"),
+    "me": StateRow("me", "Maine", "23"),
+    "md": StateRow("md", "Maryland", "24"),
+    "ma": StateRow("ma", "Massachusetts", "25"),
+    "mi": StateRow("mi", "Michigan", "26"),
+    "mn": StateRow("mn", "Minnesota", "27"),
+    "ms": StateRow("ms", "Mississippi", "28"),
+    "mo": StateRow("mo", "Missouri", "29"),
+    "mt": StateRow("mt", "Montana", "30"),
+    "ne": StateRow("ne", "Nebraska", "31"),
+    "nv": StateRow("nv", "Nevada", "32"),
+    "nh": StateRow("nh", "New Hampshire", "33"),
+    "nj": StateRow("nj", "New Jersey", "34"),
+    "nm": StateRow("nm", "New Mexico", "35"),
+    "ny": StateRow("ny", "New York", "36"),
+    "nc": StateRow("nc", "North Carolina", "37"),
+    "nd": StateRow("nd", "North Dakota", "38"),
+    "oh": StateRow("oh", "Ohio", "39"),
+    "ok": StateRow("ok", "Oklahoma", "40"),
+    "or": StateRow("or", "Oregon", "41"),
+    "pa": StateRow("pa", "Pennsylvania", "42"),
+    "ri": StateRow("ri", "Rhode Island", "44"),
+    "sc": StateRow("sc", "South Carolina", "45"),
+    "sd": StateRow("sd", "South Dakota", "46"),
+    "tn": StateRow("tn", "Tennessee", "47"),
+    "tx": StateRow("tx", "Texas", "48"),
+    "ut": StateRow("ut", "Utah", "49"),
+    "vt": StateRow("vt", "Vermont", "50"),
+    "va": StateRow("va", "Virginia", "51"),
+    "wa": StateRow("wa", "Washington", "53"),
+    "wv": StateRow("wv", "West Virginia", "54"),
+    "wi": StateRow("wi", "Wisconsin", "55"),
+    "wy": StateRow("wy", "Wyoming", "56"),
+    "pr": StateRow("pr", "Puerto Rico", "72"),
 }
 
+# Indexes for constant-time state lookups; FIPS codes stay zero-padded strings
+STATES_BY_FIPS: dict[str, StateRow] = {state.fips: state for state in US_STATES.values()}
+STATES_BY_NAME: dict[str, StateRow] = {state.name.lower(): state for state in US_STATES.values()}
+
+# (code, name) for every state, sorted by name
+_STATES_SORTED: tuple[tuple[str, str], ...] = tuple(
+    sorted(((state.code, state.name) for state in US_STATES.values()), key=lambda x: x[1])
+)
+
 # TIGER layer types with descriptions
-TIGER_LAYERS = {
-    "cousub": {
-        "name": "County Subdivisions",
-        "description": "Towns, townships, and other county subdivisions",
-        "geometry": "polygon",
-    },
-    "areawater": {
-        "name": "Area Water",
-        "description": "Lakes, ponds, reservoirs, and other water bodies",
-        "geometry": "polygon",
-    },
-    "linearwater": {
-        "name": "Linear Water",
-        "description": "Rivers, streams, and other linear water features",
-        "geometry": "line",
-    },
-    "prisecroads": {
-        "name": "Primary & Secondary Roads",
-        "description": "Interstates, US routes, and state highways",
-        "geometry": "line",
-    },
-    "county": {
-        "name": "Counties",
-        "description": "County boundaries",
-        "geometry": "polygon",
-    },
-    "state": {
-        "name": "State Outline",
-        "description": "State boundary",
-        "geometry": "polygon",
-    },
-    "place": {
-        "name": "Places",
-        "description": "Cities, towns, CDPs, and other populated places",
-        "geometry": "polygon",
-    },
-    "tract": {
-        "name": "Census Tracts",
-        "description": "Census tract boundaries (for demographic data)",
-        "geometry": "polygon",
-    },
+TIGER_LAYERS: dict[str, LayerRow] = {
+    "cousub": LayerRow(
+        "cousub",
+        "County Subdivisions",
+        "Towns, townships, and other county subdivisions",
+        "polygon",
+    ),
+    "areawater": LayerRow(
+        "areawater",
+        "Area Water",
+        "Lakes, ponds, reservoirs, and other water bodies",
+        "polygon",
+    ),
+    "linearwater": LayerRow(
+        "linearwater",
+        "Linear Water",
+        "Rivers, streams, and other linear water features",
+        "line",
+    ),
+    "prisecroads": LayerRow(
+        "prisecroads",
+        "Primary & Secondary Roads",
+        "Interstates, US routes, and state highways",
+        "line",
+    ),
+    "county": LayerRow(
+        "county",
+        "Counties",
+        "County boundaries",
+        "polygon",
+    ),
+    "state": LayerRow(
+        "state",
+        "State Outline",
+        "State boundary",
+        "polygon",
+    ),
+    "place": LayerRow(
+        "place",
+        "Places",
+        "Cities, towns, CDPs, and other populated places",
+        "polygon",
+    ),
+    "tract": LayerRow(
+        "tract",
+        "Census Tracts",
+        "Census tract boundaries (for demographic data)",
+        "polygon",
+    ),
 }
 
 # Quebec administrative layers
-QUEBEC_LAYERS = {
-    "municipalities": {
-        "name": "Municipalities",
-        "description": "Municipal boundaries (villes, municipalités, paroisses)",
-        "geometry": "polygon",
-        "features": "~2,263",
-    },
-    "mrc": {
-        "name": "MRCs",
-        "description": "Municipalités régionales de comté (regional county municipalities)",
-        "geometry": "polygon",
-        "features": "138",
-    },
-    "regions": {
-        "name": "Administrative Regions",
-        "description": "Quebec's 17 administrative regions",
-        "geometry": "polygon",
-        "features": "21",
-    },
-    "metropolitan": {
-        "name": "Metropolitan Communities",
-        "description": "Communautés métropolitaines (Montreal, Quebec City)",
-        "geometry": "polygon",
-        "features": "2",
-    },
+QUEBEC_LAYERS: dict[str, LayerRow] = {
+    "municipalities": LayerRow(
+        "municipalities",
+        "Municipalities",
+        "Municipal boundaries (villes, municipalités, paroisses)",
+        "polygon",
+        features="~2,263",
+    ),
+    "mrc": LayerRow(
+        "mrc",
+        "MRCs",
+        "Municipalités régionales de comté (regional county municipalities)",
+        "polygon",
+        features="138",
+    ),
+    "regions": LayerRow(
+        "regions",
+        "Administrative Regions",
+        "Quebec's 17 administrative regions",
+        "polygon",
+        features="21",
+    ),
+    "metropolitan": LayerRow(
+        "metropolitan",
+        "Metropolitan Communities",
+        "Communautés métropolitaines (Montreal, Quebec City)",
+        "polygon",
+        features="2",
+    ),
 }
 
 # Canada-wide data layers (CanVec and NRN)
-CANADA_LAYERS = {
+CANADA_LAYERS: dict[str, dict[str, Any]] = {
     "canvec_hydro": {
         "name": "CanVec Hydro (1M)",
         "description": "Lakes and rivers from Natural Resources Canada CanVec 1:1,000,000",
@@ -149,7 +193,7 @@ CANADA_LAYERS = {
 }
 
 # National Road Network by province/territory
-NRN_PROVINCES = {
+NRN_PROVINCES: dict[str, dict[str, Any]] = {
     # Eastern
     "nl": {"name": "Newfoundland & Labrador", "size_mb": 25},
     "pe": {"name": "Prince Edward Island", "size_mb": 5},
@@ -169,7 +213,7 @@ NRN_PROVINCES = {
 }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CatalogEntry:
     """A single entry in the data source catalog."""
 
@@ -183,50 +227,49 @@ class CatalogEntry:
     estimated_size_mb: float | None = None
 
 
-def build_census_catalog(year: str = "2023") -> list[CatalogEntry]:
-    """Build catalog entries for all Census TIGER layers."""
+@cache
+def build_census_catalog(year: str = "2023") -> tuple[CatalogEntry, ...]:
+    """Build catalog entries for all Census TIGER layers (cached per year)."""
     entries = []
 
-    for state_code, state_info in US_STATES.items():
-        state_name = state_info["name"]
-
-        for layer_code, layer_info in TIGER_LAYERS.items():
-            uri = f"census:tiger/{year}/{state_code}/{layer_code}"
+    for state in US_STATES.values():
+        for layer in TIGER_LAYERS.values():
             entries.append(
                 CatalogEntry(
-                    uri=uri,
-                    name=f"{state_name} - {layer_info['name']}",
-                    description=layer_info["description"],
-                    geometry=layer_info["geometry"],
+                    uri=f"census:tiger/{year}/{state.code}/{layer.code}",
+                    name=f"{state.name} - {layer.name}",
+                    description=layer.description,
+                    geometry=layer.geometry,
                     source_type="census",
-                    region=state_name,
+                    region=state.name,
                 )
             )
 
-    return entries
+    return tuple(entries)
 
 
-def build_quebec_catalog() -> list[CatalogEntry]:
+@cache
+def build_quebec_catalog() -> tuple[CatalogEntry, ...]:
     """Build catalog entries for Quebec administrative boundaries."""
     entries = []
 
-    for layer_code, layer_info in QUEBEC_LAYERS.items():
-        uri = f"quebec:{layer_code}"
+    for layer in QUEBEC_LAYERS.values():
         entries.append(
             CatalogEntry(
-                uri=uri,
-                name=f"Quebec - {layer_info['name']}",
-                description=layer_info["description"],
-                geometry=layer_info["geometry"],
+                uri=f"quebec:{layer.code}",
+                name=f"Quebec - {layer.name}",
+                description=layer.description,
+                geometry=layer.geometry,
                 source_type="quebec",
                 region="Quebec",
             )
         )
 
-    return entries
+    return tuple(entries)
 
 
-def build_canada_catalog() -> list[CatalogEntry]:
+@cache
+def build_canada_catalog() -> tuple[CatalogEntry, ...]:
     """Build catalog entries for Canada-wide data sources."""
     entries = []
 
@@ -258,52 +301,103 @@ def build_canada_catalog() -> list[CatalogEntry]:
             )
         )
 
-    return entries
+    return tuple(entries)
 
 
-def get_full_catalog() -> list[CatalogEntry]:
-    """Get the complete data source catalog."""
-    entries = []
-    entries.extend(build_census_catalog())
-    entries.extend(build_quebec_catalog())
-    entries.extend(build_canada_catalog())
-    return entries
+@cache
+def get_full_catalog() -> tuple[CatalogEntry, ...]:
+    """
+    Get the complete data source catalog.
+
+    The catalog is built once and shared; entries are frozen, so callers
+    that need to modify the sequence should copy it with list().
+    """
+    return build_census_catalog() + build_quebec_catalog() + build_canada_catalog()
 
 
-def get_states_list() -> list[tuple[str, str]]:
-    """Get list of (code, name) tuples for all states, sorted by name."""
-    return sorted(
-        [(code, info["name"]) for code, info in US_STATES.items()],
-        key=lambda x: x[1],
-    )
+@lru_cache(maxsize=1)
+def _catalog_columns() -> dict[str, np.ndarray]:
+    """Columnar view of the full catalog, aligned with get_full_catalog()."""
+    entries = get_full_catalog()
+    return {
+        "region": np.array([e.region for e in entries]),
+        "geometry": np.array([e.geometry for e in entries]),
+        "source_type": np.array([e.source_type for e in entries]),
+        # Lowercased name, URI and description for substring search
+        "text": np.array([f"{e.name}\n{e.uri}\n{e.description}".lower() for e in entries]),
+    }
+
+
+@lru_cache(maxsize=128)
+def filter_catalog(
+    region: str | None = None,
+    geometry: str | None = None,
+    source_type: str | None = None,
+    query: str | None = None,
+) -> tuple[CatalogEntry, ...]:
+    """
+    Filter the full catalog.
+
+    Each criterion is evaluated as a vectorized mask over the catalog
+    columns, so filtering doesn't loop over entries in Python. The catalog
+    and its entries are immutable, so results are cached per criteria.
+
+    Args:
+        region: Exact state/province name
+        geometry: polygon, line or point
+        source_type: census, quebec or canada
+        query: Case-insensitive substring of the name, URI or description
+
+    Returns:
+        Matching entries in catalog order
+    """
+    columns = _catalog_columns()
+    mask = np.ones(len(columns["region"]), dtype=bool)
+    for column, value in (("region", region), ("geometry", geometry), ("source_type", source_type)):
+        if value is not None:
+            mask &= columns[column] == value
+    if query:
+        mask &= np.char.find(columns["text"], query.lower()) >= 0
+
+    entries = get_full_catalog()
+    return tuple(entries[i] for i in np.flatnonzero(mask))
+
+
+def lookup_state(query: str) -> StateRow | None:
+    """
+    Find a state by postal code ("vt"), FIPS code ("50") or name ("Vermont").
+
+    Matching is case-insensitive. Returns None if nothing matches.
+    """
+    key = query.strip().lower()
+    return US_STATES.get(key) or STATES_BY_FIPS.get(key) or STATES_BY_NAME.get(key)
+
+
+def get_states_list() -> tuple[tuple[str, str], ...]:
+    """Get (code, name) tuples for all states, sorted by name."""
+    return _STATES_SORTED
+
+
+# (code, name, description) of the layers offered per source type
+_LAYERS_BY_SOURCE: dict[str, tuple[tuple[str, str, str], ...]] = {
+    "census": tuple((layer.code, layer.name, layer.description) for layer in TIGER_LAYERS.values()),
+    "quebec": tuple((layer.code, layer.name, layer.description) for layer in QUEBEC_LAYERS.values()),
+    "canada": tuple(
+        (code, info["name"], info["description"]) for code, info in CANADA_LAYERS.items()
+    ) + tuple(
+        (
+            f"nrn/{prov_code}",
+            f"NRN Roads - {prov_info['name']}",
+            f"National Road Network for {prov_info['name']}",
+        )
+        for prov_code, prov_info in NRN_PROVINCES.items()
+    ),
+}
 
 
-def get_layers_for_source(source_type: str) -> list[tuple[str, str, str]]:
+def get_layers_for_source(source_type: str) -> tuple[tuple[str, str, str], ...]:
     """Get available layers for a source type.
 
-    Returns list of (code, name, description) tuples.
+    Returns tuple of (code, name, description) tuples, empty for unknown types.
     """
-    if source_type == "census":
-        return [
-            (code, info["name"], info["description"])
-            for code, info in TIGER_LAYERS.items()
-        ]
-    elif source_type == "quebec":
-        return [
-            (code, info["name"], info["description"])
-            for code, info in QUEBEC_LAYERS.items()
-        ]
-    elif source_type == "canada":
-        layers = [
-            (code, info["name"], info["description"])
-            for code, info in CANADA_LAYERS.items()
-        ]
-        # Add NRN provinces
-        for prov_code, prov_info in NRN_PROVINCES.items():
-            layers.append((
-                f"nrn/{prov_code}",
-                f"NRN Roads - {prov_info['name']}",
-                f"National Road Network for {prov_info['name']}",
-            ))
-        return layers
-    return []
+    return _LAYERS_BY_SOURCE.get(source_type, ())
@@ -4,6 +4,8 @@ Configuration debugger TUI.
 Interactive error fixing for malformed .strata.yaml files.
 """
 
+import os
+import subprocess
 from pathlib import Path
 
 from textual.app import App, ComposeResult
@@ -74,9 +76,6 @@ class ConfigDebugger(App):
 
     def action_edit(self) -> None:
         """Open in external editor."""
-        import os
-        import subprocess
-
         editor = os.environ.get("EDITOR", "vim")
         subprocess.run([editor, str(self.recipe_path)])
 
@@ -1,10 +1,7 @@
 """TUI screens for Strata wizard."""
 
-from .welcome import WelcomeScreen
-from .source_browser import SourceBrowserScreen
-from .bounds import BoundsScreen
-from .layer_config import LayerConfigScreen
-from .output_config import OutputConfigScreen
+from importlib import import_module
+from typing import Any
 
 __all__ = [
     "WelcomeScreen",
@@ -13,3 +10,25 @@ __all__ = [
     "LayerConfigScreen",
     "OutputConfigScreen",
 ]
+
+# Screens are imported on first use so opening one doesn't load them all
+_SCREEN_MODULES = {
+    "WelcomeScreen": "welcome",
+    "SourceBrowserScreen": "source_browser",
+    "BoundsScreen": "bounds",
+    "LayerConfigScreen": "layer_config",
+    "OutputConfigScreen": "output_config",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _SCREEN_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    screen = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = screen
+    return screen
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
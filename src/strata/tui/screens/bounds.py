@@ -1,5 +1,10 @@
 """Bounds configuration screen - set map boundaries."""
 
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
@@ -8,7 +13,7 @@ from textual.widgets import Button, Footer, Header, Input, Label, Static, RadioS
 
 
 # Common preset bounds for quick selection
-PRESET_BOUNDS = {
+PRESET_BOUNDS: dict[str, dict[str, Any]] = {
     "vermont": {
         "name": "Vermont (Full State)",
         "bounds": [-73.44, 42.72, -71.46, 45.02],
@@ -46,6 +51,41 @@ PRESET_BOUNDS = {
     },
 }
 
+# All preset boxes as one (N, 4) array of [west, south, east, north], in
+# PRESET_BOUNDS order, for vectorized comparisons
+_PRESET_KEYS = tuple(PRESET_BOUNDS)
+_PRESET_BBOX = np.array(
+    [PRESET_BOUNDS[key]["bounds"] for key in _PRESET_KEYS], dtype=np.float32
+)
+
+
+def nearest_preset(bbox: Sequence[float] | np.ndarray) -> str:
+    """
+    Find the preset whose bounds are closest to a bounding box.
+
+    Args:
+        bbox: [west, south, east, north]
+
+    Returns:
+        Key into PRESET_BOUNDS of the preset with the smallest L1 distance
+    """
+    distances = np.abs(_PRESET_BBOX - np.asarray(bbox, dtype=np.float32)).sum(axis=1)
+    return _PRESET_KEYS[int(distances.argmin())]
+
+
+# Presets keyed by the id of their radio button
+PRESETS_BY_BUTTON_ID = {f"preset-{key}": preset for key, preset in PRESET_BOUNDS.items()}
+
+# Static copy, parsed once rather than on every compose
+INTRO_TEXT = Text.from_markup(
+    "\nDefine the geographic area for your map.\n"
+    "You can select a preset or enter custom coordinates.\n"
+)
+TIP_TEXT = Text.from_markup(
+    "Tip: After continuing, you'll see an SVG preview where you can\n"
+    "visually adjust the crop area."
+)
+
 
 class BoundsScreen(Screen):
     """Configure map boundaries."""
@@ -118,19 +158,14 @@ class BoundsScreen(Screen):
 
         yield Container(
             Static("[3/5] Configure Bounds", id="step"),
-            Static(
-                "\nDefine the geographic area for your map.\n"
-                "You can select a preset or enter custom coordinates.\n",
-            ),
+            Static(INTRO_TEXT),
             Vertical(
                 Static("Presets", classes="section-title"),
                 RadioSet(
-                    RadioButton("Vermont (Full State)", id="preset-vermont"),
-                    RadioButton("Lake Champlain Region", id="preset-lake_champlain"),
-                    RadioButton("Lake Champlain + Quebec", id="preset-lake_champlain_quebec"),
-                    RadioButton("Hawaiian Islands", id="preset-hawaii"),
-                    RadioButton("Oahu", id="preset-oahu"),
-                    RadioButton("Niagara Falls Region", id="preset-niagara"),
+                    *(
+                        RadioButton(preset["name"], id=button_id)
+                        for button_id, preset in PRESETS_BY_BUTTON_ID.items()
+                    ),
                     RadioButton("Custom (enter below)", id="preset-custom", value=True),
                     id="preset-radio",
                 ),
@@ -154,11 +189,7 @@ class BoundsScreen(Screen):
                 ),
                 id="manual-section",
             ),
-            Static(
-                "Tip: After continuing, you'll see an SVG preview where you can\n"
-                "visually adjust the crop area.",
-                id="preview-info",
-            ),
+            Static(TIP_TEXT, id="preview-info"),
             Horizontal(
                 Button("<- Back", id="back-btn"),
                 Button("Preview Bounds", id="preview-btn", variant="warning"),
@@ -170,44 +201,67 @@ class BoundsScreen(Screen):
 
         yield Footer()
 
+    def on_mount(self) -> None:
+        """Resolve the bounds inputs once; they're read on every preset and validation."""
+        self._west = self.query_one("#west", Input)
+        self._south = self.query_one("#south", Input)
+        self._east = self.query_one("#east", Input)
+        self._north = self.query_one("#north", Input)
+
     def on_radio_set_changed(self, event: RadioSet.Changed) -> None:
         """Handle preset selection."""
-        button_id = str(event.pressed.id)
-        if button_id.startswith("preset-"):
-            preset_key = button_id[7:]  # Remove "preset-" prefix
-
-            if preset_key in PRESET_BOUNDS:
-                preset = PRESET_BOUNDS[preset_key]
-                bounds = preset["bounds"]
-
-                # Update input fields
-                self.query_one("#west", Input).value = str(bounds[0])
-                self.query_one("#south", Input).value = str(bounds[1])
-                self.query_one("#east", Input).value = str(bounds[2])
-                self.query_one("#north", Input).value = str(bounds[3])
-
-                self.notify(f"Selected: {preset['name']}")
+        preset = PRESETS_BY_BUTTON_ID.get(str(event.pressed.id))
+        if preset is None:
+            return  # Custom bounds
+
+        # Update input fields
+        bounds = preset["bounds"]
+        self._west.value = str(bounds[0])
+        self._south.value = str(bounds[1])
+        self._east.value = str(bounds[2])
+        self._north.value = str(bounds[3])
+
+        self.notify(f"Selected: {preset['name']}")
+
+    def _parse_bounds(self) -> tuple[list[float] | None, str | None]:
+        """
+        Parse the four bounds inputs in west, south, east, north order.
+
+        Returns:
+            (values, None) on success, or (None, field name) for the first
+            input that isn't a number
+        """
+        values = []
+        for name, field in (
+            ("West", self._west),
+            ("South", self._south),
+            ("East", self._east),
+            ("North", self._north),
+        ):
+            try:
+                values.append(float(field.value))
+            except ValueError:
+                return None, name
+        return values, None
 
     def _get_bounds(self) -> list[float] | None:
         """Get current bounds from inputs."""
-        try:
-            west = float(self.query_one("#west", Input).value)
-            south = float(self.query_one("#south", Input).value)
-            east = float(self.query_one("#east", Input).value)
-            north = float(self.query_one("#north", Input).value)
-
-            # Validate
-            if south >= north:
-                self.notify("South must be less than North", severity="error")
-                return None
-            if west >= east and not (west > 0 and east < 0):  # Allow antimeridian crossing
-                self.notify("West must be less than East", severity="error")
-                return None
-
-            return [west, south, east, north]
-        except ValueError:
-            self.notify("Please enter valid numeric coordinates", severity="error")
+        bounds, bad_field = self._parse_bounds()
+        if bounds is None:
+            self.notify(f"{bad_field} is not a number", severity="error")
+            return None
+        west, south, east, north = bounds
+
+        # Validate
+        if not south < north:
+            self.notify("South must be less than North", severity="error")
             return None
+        crosses_antimeridian = west > 0 > east
+        if not (west < east or crosses_antimeridian):
+            self.notify("West must be less than East", severity="error")
+            return None
+
+        return bounds
 
     def action_back(self) -> None:
         """Go back to source browser."""
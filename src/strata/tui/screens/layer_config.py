@@ -1,5 +1,8 @@
 """Layer configuration screen - configure map layers from sources."""
 
+from dataclasses import dataclass
+from typing import Any
+
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
@@ -40,22 +43,37 @@ DEFAULT_STYLES = {
     },
 }
 
+# List row icons by geometry type
+GEOMETRY_ICONS = {"polygon": "[P]", "line": "[L]", "point": "[.]"}
+
 # Common operations by layer type
 COMMON_OPERATIONS = {
-    "cousub": ["subtract water", "simplify"],
-    "areawater": ["simplify"],
-    "linearwater": ["simplify"],
-    "prisecroads": ["simplify"],
-    "county": ["simplify"],
-    "state": ["simplify"],
-    "place": ["simplify"],
-    "tract": ["simplify"],
-    "municipalities": ["simplify"],
-    "mrc": ["simplify"],
-    "regions": ["simplify"],
+    "cousub": ("subtract water", "simplify"),
+    "areawater": ("simplify",),
+    "linearwater": ("simplify",),
+    "prisecroads": ("simplify",),
+    "county": ("simplify",),
+    "state": ("simplify",),
+    "place": ("simplify",),
+    "tract": ("simplify",),
+    "municipalities": ("simplify",),
+    "mrc": ("simplify",),
+    "regions": ("simplify",),
 }
 
 
+@dataclass(slots=True)
+class Layer:
+    """A map layer being configured in the wizard."""
+
+    name: str
+    source: str  # Source URI
+    order: int  # Draw order, 1 = bottom
+    style: dict[str, Any]
+    operations: list[dict[str, Any]]
+    geometry: str | None = None  # polygon, line, point
+
+
 class LayerConfigScreen(Screen):
     """Configure layers from selected sources."""
 
@@ -125,8 +143,9 @@ class LayerConfigScreen(Screen):
 
     def __init__(self) -> None:
         super().__init__()
-        self.layers: list[dict] = []
+        self.layers: list[Layer] = []
         self.selected_layer_idx: int = 0
+        self._rendered_labels: list[Label] = []
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -197,63 +216,50 @@ class LayerConfigScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
-        """Initialize layers from selected sources."""
-        sources = self.app.recipe_data.get("sources", {})
-        if sources:
+        """Resolve the form widgets once and initialize layers from selected sources."""
+        self._layer_list = self.query_one("#layer-list", ListView)
+        self._stroke_color = self.query_one("#stroke-color", Input)
+        self._stroke_width = self.query_one("#stroke-width", Input)
+        self._fill_color = self.query_one("#fill-color", Input)
+        self._vary_fill = self.query_one("#vary-fill", Checkbox)
+        if self.app.recipe_data.get("sources"):
             self._auto_configure_layers()
 
     def _auto_configure_layers(self) -> None:
         """Auto-configure layers based on selected sources."""
         sources = self.app.recipe_data.get("sources", {})
 
-        self.layers = []
-        order = 1
-
         # Sort sources by type for logical layer ordering
-        # Polygons first (base), then lines (roads), then points (POIs)
-        polygon_sources = []
-        line_sources = []
-        point_sources = []
-        water_sources = []
-
+        # Polygons first (base), then water, then lines (roads), then points (POIs)
+        buckets: dict[str, list[tuple[str, dict[str, Any]]]] = {
+            "polygon": [],
+            "water": [],
+            "line": [],
+            "point": [],
+        }
         for uri, info in sources.items():
-            geom = info.get("geometry", "polygon")
-            name = info.get("name", uri.split(":")[-1])
-
-            # Detect water sources
-            if "water" in uri.lower() or "water" in name.lower():
-                water_sources.append((uri, info))
-            elif geom == "polygon":
-                polygon_sources.append((uri, info))
-            elif geom == "line":
-                line_sources.append((uri, info))
+            # Detect water sources (the name defaults to part of the URI)
+            if "water" in uri.lower() or "water" in info.get("name", "").lower():
+                category = "water"
             else:
-                point_sources.append((uri, info))
+                geom = info.get("geometry", "polygon")
+                category = geom if geom in ("polygon", "line") else "point"
+            buckets[category].append((uri, info))
 
         # Build layers in order: base polygons, water, roads, points
-        for uri, info in polygon_sources:
-            layer = self._create_layer(uri, info, order)
-            # Auto-add subtract water if we have water sources
-            if water_sources:
-                layer["operations"].insert(0, {"type": "subtract", "target": "water"})
-            self.layers.append(layer)
-            order += 1
-
-        for uri, info in water_sources:
-            self.layers.append(self._create_layer(uri, info, order))
-            order += 1
-
-        for uri, info in line_sources:
-            self.layers.append(self._create_layer(uri, info, order))
-            order += 1
-
-        for uri, info in point_sources:
-            self.layers.append(self._create_layer(uri, info, order))
-            order += 1
+        has_water = bool(buckets["water"])
+        self.layers = []
+        for category in ("polygon", "water", "line", "point"):
+            for uri, info in buckets[category]:
+                layer = self._create_layer(uri, info, len(self.layers) + 1)
+                # Auto-add subtract water to base polygons if we have water sources
+                if category == "polygon" and has_water:
+                    layer.operations.insert(0, {"type": "subtract", "target": "water"})
+                self.layers.append(layer)
 
         self._update_layer_list()
 
-    def _create_layer(self, uri: str, info: dict, order: int) -> dict:
+    def _create_layer(self, uri: str, info: dict[str, Any], order: int) -> Layer:
         """Create a layer configuration from a source."""
         geom = info.get("geometry", "polygon")
         name_parts = uri.split("/")
@@ -265,68 +271,82 @@ class LayerConfigScreen(Screen):
         # Default operations
         operations = [{"type": "simplify", "tolerance": 0.0003}]
 
-        return {
-            "name": layer_name,
-            "source": uri,
-            "source_info": info,
-            "order": order,
-            "style": style,
-            "operations": operations,
-        }
+        return Layer(
+            name=layer_name,
+            source=uri,
+            order=order,
+            style=style,
+            operations=operations,
+            geometry=info.get("geometry"),
+        )
 
     def _update_layer_list(self) -> None:
-        """Update the layer list view."""
-        list_view = self.query_one("#layer-list", ListView)
+        """Rebuild the layer list view."""
+        list_view = self._layer_list
         list_view.clear()
 
-        for i, layer in enumerate(self.layers):
-            prefix = ">" if i == self.selected_layer_idx else " "
-            geom = layer["source_info"].get("geometry", "?")
-            icon = {"polygon": "[P]", "line": "[L]", "point": "[.]"}.get(geom, "[?]")
-            list_view.append(
-                ListItem(Label(f"{prefix} {layer['order']}. {icon} {layer['name']}"))
-            )
+        self._rendered_labels = [Label(self._layer_label(i)) for i in range(len(self.layers))]
+        # Mount all rows in one call so the list lays out once
+        list_view.extend([ListItem(label) for label in self._rendered_labels])
+
+    def _layer_label(self, idx: int) -> str:
+        """Label text for the layer at idx."""
+        layer = self.layers[idx]
+        prefix = ">" if idx == self.selected_layer_idx else " "
+        icon = GEOMETRY_ICONS.get(layer.geometry or "", "[?]")
+        return f"{prefix} {layer.order}. {icon} {layer.name}"
+
+    def _refresh_rows(self, *indices: int) -> None:
+        """Update the labels of the given rows in place."""
+        if len(self._rendered_labels) != len(self.layers):
+            self._update_layer_list()
+            return
+        for idx in indices:
+            if 0 <= idx < len(self.layers):
+                self._rendered_labels[idx].update(self._layer_label(idx))
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Handle layer selection."""
+        previous = self.selected_layer_idx
         self.selected_layer_idx = event.list_view.index
+        self._refresh_rows(previous, self.selected_layer_idx)
         self._load_layer_config()
 
     def _load_layer_config(self) -> None:
         """Load the selected layer's config into the form."""
         if 0 <= self.selected_layer_idx < len(self.layers):
             layer = self.layers[self.selected_layer_idx]
-            style = layer.get("style", {})
+            style = layer.style
 
-            self.query_one("#stroke-color", Input).value = style.get("stroke", "#424242")
-            self.query_one("#stroke-width", Input).value = str(style.get("stroke_width", 0.5))
-            self.query_one("#fill-color", Input).value = style.get("fill", "") or "none"
-            self.query_one("#vary-fill", Checkbox).value = style.get("vary_fill", False)
+            self._stroke_color.value = style.get("stroke", "#424242")
+            self._stroke_width.value = str(style.get("stroke_width", 0.5))
+            self._fill_color.value = style.get("fill", "") or "none"
+            self._vary_fill.value = style.get("vary_fill", False)
 
     def action_move_up(self) -> None:
         """Move selected layer up (draws earlier/below)."""
         if self.selected_layer_idx > 0:
-            self.layers[self.selected_layer_idx], self.layers[self.selected_layer_idx - 1] = (
-                self.layers[self.selected_layer_idx - 1],
-                self.layers[self.selected_layer_idx],
-            )
-            # Update order numbers
-            for i, layer in enumerate(self.layers):
-                layer["order"] = i + 1
-            self.selected_layer_idx -= 1
-            self._update_layer_list()
+            self._swap_layers(self.selected_layer_idx, self.selected_layer_idx - 1)
 
     def action_move_down(self) -> None:
         """Move selected layer down (draws later/above)."""
         if self.selected_layer_idx < len(self.layers) - 1:
-            self.layers[self.selected_layer_idx], self.layers[self.selected_layer_idx + 1] = (
-                self.layers[self.selected_layer_idx + 1],
-                self.layers[self.selected_layer_idx],
-            )
-            for i, layer in enumerate(self.layers):
-                layer["order"] = i + 1
-            self.selected_layer_idx += 1
-            self._update_layer_list()
+            self._swap_layers(self.selected_layer_idx, self.selected_layer_idx + 1)
+
+    def _swap_layers(self, idx: int, target: int) -> None:
+        """Swap the selected layer at idx with its neighbour and keep it selected."""
+        self.layers[idx], self.layers[target] = self.layers[target], self.layers[idx]
+        # Only the two swapped layers change position
+        self.layers[idx].order = idx + 1
+        self.layers[target].order = target + 1
+        self.selected_layer_idx = target
+        self._refresh_rows(idx, target)
+        self._layer_list.index = target
+
+    def _renumber(self) -> None:
+        """Reset layer order numbers after layers are added or removed."""
+        for i, layer in enumerate(self.layers):
+            layer.order = i + 1
 
     def action_back(self) -> None:
         """Go back to bounds screen."""
@@ -361,7 +381,8 @@ class LayerConfigScreen(Screen):
         elif event.button.id == "remove-btn":
             if self.layers and self.selected_layer_idx < len(self.layers):
                 removed = self.layers.pop(self.selected_layer_idx)
-                self.notify(f"Removed: {removed['name']}")
+                self._renumber()
+                self.notify(f"Removed: {removed.name}")
                 if self.selected_layer_idx >= len(self.layers):
                     self.selected_layer_idx = max(0, len(self.layers) - 1)
                 self._update_layer_list()
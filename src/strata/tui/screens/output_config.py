@@ -1,12 +1,14 @@
 """Output configuration screen - configure output formats and generate recipe."""
 
 from pathlib import Path
+from typing import IO, Any
 
 import yaml
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import (
     Button,
     Checkbox,
@@ -19,9 +21,11 @@ from textual.widgets import (
     TextArea,
 )
 
+from ...maury.recipe import Dumper
+
 
 # Common page sizes for plotter output
-PAGE_SIZES = {
+PAGE_SIZES: dict[str, list[float]] = {
     "letter": [8.5, 11],
     "tabloid": [11, 17],
     "12x24": [12, 24],
@@ -30,6 +34,10 @@ PAGE_SIZES = {
     "a4": [8.27, 11.69],
     "a3": [11.69, 16.54],
 }
+_PAGE_SIZE_OPTIONS = tuple((name, name) for name in PAGE_SIZES)
+
+# Seconds of input inactivity before the recipe preview is regenerated
+PREVIEW_DELAY = 0.15
 
 
 class OutputConfigScreen(Screen):
@@ -92,6 +100,14 @@ class OutputConfigScreen(Screen):
     }
     """
 
+    def __init__(self) -> None:
+        super().__init__()
+        self._preview_timer: Timer | None = None
+        self._preview_state: tuple[str | bool, ...] | None = None  # Form state the preview shows
+        self._preview_text = ""  # Text currently loaded in the preview area
+        self._preview_head: str | None = None  # YAML for everything above `output:`
+        self._preview_cache: dict[tuple[str | bool, ...], str] = {}  # Form state -> `output:` YAML
+
     def compose(self) -> ComposeResult:
         yield Header()
 
@@ -102,7 +118,7 @@ class OutputConfigScreen(Screen):
                 Horizontal(
                     Label("Preset:"),
                     Select(
-                        [(name, name) for name in PAGE_SIZES.keys()],
+                        _PAGE_SIZE_OPTIONS,
                         id="page-preset",
                         value="12x24",
                     ),
@@ -152,7 +168,15 @@ class OutputConfigScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
-        """Generate initial preview."""
+        """Resolve the form widgets once and generate the initial preview."""
+        self._page_width = self.query_one("#page-width", Input)
+        self._page_height = self.query_one("#page-height", Input)
+        self._margin = self.query_one("#margin", Input)
+        self._fmt_svg = self.query_one("#fmt-svg", Checkbox)
+        self._fmt_geojson = self.query_one("#fmt-geojson", Checkbox)
+        self._per_layer = self.query_one("#per-layer", Checkbox)
+        self._combined = self.query_one("#combined", Checkbox)
+        self._preview_area = self.query_one("#preview-area", TextArea)
         self._update_preview()
 
     def on_select_changed(self, event: Select.Changed) -> None:
@@ -161,20 +185,32 @@ class OutputConfigScreen(Screen):
             preset = str(event.value)
             if preset in PAGE_SIZES:
                 size = PAGE_SIZES[preset]
-                self.query_one("#page-width", Input).value = str(size[0])
-                self.query_one("#page-height", Input).value = str(size[1])
-                self._update_preview()
+                self._page_width.value = str(size[0])
+                self._page_height.value = str(size[1])
+                self._schedule_preview()
 
     def on_input_changed(self, event: Input.Changed) -> None:
         """Update preview when inputs change."""
-        self._update_preview()
+        self._schedule_preview()
 
     def on_checkbox_changed(self, event: Checkbox.Changed) -> None:
         """Update preview when checkboxes change."""
-        self._update_preview()
+        self._schedule_preview()
 
-    def _build_recipe(self) -> dict:
+    def _schedule_preview(self) -> None:
+        """Update the preview once input settles, coalescing bursts of changes."""
+        if self._preview_timer is not None:
+            self._preview_timer.stop()
+        self._preview_timer = self.set_timer(PREVIEW_DELAY, self._update_preview)
+
+    def _build_recipe(self) -> dict[str, Any]:
         """Build the recipe dictionary from wizard data."""
+        recipe = self._build_recipe_head()
+        recipe.update(self._build_output_section())
+        return recipe
+
+    def _build_recipe_head(self) -> dict[str, Any]:
+        """Build the name, sources and layers sections from earlier wizard steps."""
         data = self.app.recipe_data
 
         # Build sources section and create URI -> source name mapping
@@ -210,29 +246,37 @@ class OutputConfigScreen(Screen):
         layers = []
         for layer in data.get("layers", []):
             # Map the source URI to the source name we created
-            source_uri = layer.get("source", "")
-            source_name = uri_to_name.get(source_uri, layer["name"])
+            source_name = uri_to_name.get(layer.source, layer.name)
 
             layer_config = {
-                "name": layer["name"],
+                "name": layer.name,
                 "source": source_name,
-                "operations": layer.get("operations", [{"type": "simplify", "tolerance": 0.0003}]),
-                "style": layer.get("style", {}),
-                "order": layer["order"],
+                "operations": layer.operations,
+                "style": layer.style,
+                "order": layer.order,
             }
             layers.append(layer_config)
 
-        # Build output section
+        return {
+            "name": data.get("name", "untitled"),
+            "description": data.get("description", ""),
+            "version": 1,
+            "sources": sources,
+            "layers": layers,
+        }
+
+    def _build_output_section(self) -> dict[str, Any]:
+        """Build the output section from this screen's form."""
         try:
-            page_width = float(self.query_one("#page-width", Input).value)
-            page_height = float(self.query_one("#page-height", Input).value)
-            margin = float(self.query_one("#margin", Input).value)
+            page_width = float(self._page_width.value)
+            page_height = float(self._page_height.value)
+            margin = float(self._margin.value)
         except ValueError:
             page_width, page_height, margin = 12, 24, 0.5
 
         formats = []
 
-        if self.query_one("#fmt-svg", Checkbox).value:
+        if self._fmt_svg.value:
             formats.append({
                 "type": "svg",
                 "quality": [
@@ -240,30 +284,25 @@ class OutputConfigScreen(Screen):
                     {"name": "medium", "simplify": 0.0005},
                 ],
                 "options": {
-                    "per_layer": self.query_one("#per-layer", Checkbox).value,
-                    "combined": self.query_one("#combined", Checkbox).value,
+                    "per_layer": self._per_layer.value,
+                    "combined": self._combined.value,
                     "page_size": [page_width, page_height],
                     "margin": margin,
                 },
             })
 
-        if self.query_one("#fmt-geojson", Checkbox).value:
+        if self._fmt_geojson.value:
             formats.append({
                 "type": "geojson",
                 "options": {
-                    "per_layer": self.query_one("#per-layer", Checkbox).value,
+                    "per_layer": self._per_layer.value,
                     "precision": 6,
                 },
             })
 
-        bounds = data.get("bounds", [-73.44, 42.72, -71.46, 45.02])
+        bounds = self.app.recipe_data.get("bounds", [-73.44, 42.72, -71.46, 45.02])
 
-        recipe = {
-            "name": data.get("name", "untitled"),
-            "description": data.get("description", ""),
-            "version": 1,
-            "sources": sources,
-            "layers": layers,
+        return {
             "output": {
                 "bounds": bounds,
                 "projection": "epsg:4326",
@@ -271,21 +310,68 @@ class OutputConfigScreen(Screen):
             },
         }
 
-        return recipe
+    def _form_state(self) -> tuple[str | bool, ...]:
+        """
+        Fingerprint the form inputs that feed the recipe.
+
+        The wizard data from earlier screens can't change while this screen
+        is on top (going back pops it), so the form alone determines the
+        preview.
+        """
+        return (
+            self._page_width.value,
+            self._page_height.value,
+            self._margin.value,
+            self._fmt_svg.value,
+            self._fmt_geojson.value,
+            self._per_layer.value,
+            self._combined.value,
+        )
+
+    @staticmethod
+    def _dump(data: dict[str, Any], stream: IO[str] | None = None) -> str:
+        """
+        Serialize (part of) a recipe as block-style YAML.
+
+        Returns the YAML, or "" when it was written to stream instead.
+        """
+        text: str | None = yaml.dump(
+            data,
+            stream,
+            Dumper=Dumper,
+            default_flow_style=False,
+            sort_keys=False,
+            allow_unicode=True,
+        )
+        return text or ""
 
     def _update_preview(self) -> None:
         """Update the recipe preview."""
+        self._preview_timer = None
+        state = self._form_state()
+        if state == self._preview_state:
+            return  # Already showing this recipe
         try:
-            recipe = self._build_recipe()
-            yaml_str = yaml.dump(
-                recipe,
-                default_flow_style=False,
-                sort_keys=False,
-                allow_unicode=True,
-            )
-            self.query_one("#preview-area", TextArea).load_text(yaml_str)
+            # Only the output section depends on the form, so the rest is dumped once
+            if self._preview_head is None:
+                self._preview_head = self._dump(self._build_recipe_head())
+            # Serve form states seen before (e.g. toggling a checkbox back) from cache
+            output_yaml = self._preview_cache.get(state)
+            if output_yaml is None:
+                output_yaml = self._dump(self._build_output_section())
+                self._preview_cache[state] = output_yaml
+            self._set_preview_text(self._preview_head + output_yaml)
+            self._preview_state = state
         except Exception as e:
-            self.query_one("#preview-area", TextArea).load_text(f"Error: {e}")
+            self._set_preview_text(f"Error: {e}")
+
+    def _set_preview_text(self, text: str) -> None:
+        """Load text into the preview, skipping the reload when it's already shown."""
+        # Different form states can render the same YAML (e.g. "0.5" vs "0.50")
+        if text == self._preview_text:
+            return
+        self._preview_area.load_text(text)
+        self._preview_text = text
 
     def action_back(self) -> None:
         """Go back to layer config."""
@@ -300,13 +386,6 @@ class OutputConfigScreen(Screen):
         output_path = Path("examples") / f"{name}.strata.yaml"
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        yaml_str = yaml.dump(
-            recipe,
-            default_flow_style=False,
-            sort_keys=False,
-            allow_unicode=True,
-        )
-
         # Add header comment
         header = f"""# {recipe.get('description', name)}
 # Generated by Strata TUI Wizard
@@ -316,7 +395,8 @@ class OutputConfigScreen(Screen):
 
 """
         with open(output_path, "w") as f:
-            f.write(header + yaml_str)
+            f.write(header)
+            self._dump(recipe, f)
 
         self.notify(f"Recipe saved to: {output_path}", severity="information")
 
@@ -1,9 +1,13 @@
 """Source browser screen - browse and select data sources."""
 
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import (
     Button,
     Footer,
@@ -23,9 +27,88 @@ from ..catalog import (
     QUEBEC_LAYERS,
     CANADA_LAYERS,
     NRN_PROVINCES,
-    get_states_list,
 )
 
+# States grouped by region for easier navigation
+REGION_STATES = {
+    "New England": ["ct", "me", "ma", "nh", "ri", "vt"],
+    "Mid-Atlantic": ["nj", "ny", "pa"],
+    "South Atlantic": ["de", "dc", "fl", "ga", "md", "nc", "sc", "va", "wv"],
+    "East South Central": ["al", "ky", "ms", "tn"],
+    "West South Central": ["ar", "la", "ok", "tx"],
+    "East North Central": ["il", "in", "mi", "oh", "wi"],
+    "West North Central": ["ia", "ks", "mn", "mo", "ne", "nd", "sd"],
+    "Mountain": ["az", "co", "id", "mt", "nv", "nm", "ut", "wy"],
+    "Pacific": ["ak", "ca", "hi", "or", "wa"],
+    "Territories": ["pr"],
+}
+
+# (region, ((state code, tree label), ...)) resolved once for every screen push
+CENSUS_REGIONS = tuple(
+    (
+        region_name,
+        tuple(
+            (code, f"{US_STATES[code].name} ({code.upper()})")
+            for code in codes
+            if code in US_STATES
+        ),
+    )
+    for region_name, codes in REGION_STATES.items()
+)
+
+# Leaf info shared by every state's TIGER layers
+TIGER_INFO = tuple((layer.code, layer._asdict()) for layer in TIGER_LAYERS.values())
+
+
+class SourceLeaf(NamedTuple):
+    """Tree data for a selectable source."""
+
+    uri: str
+    info: dict[str, Any]
+    state: str
+    search: str  # Lowercase label, URI and description the search box matches
+    info_text: str  # Info panel text
+
+
+@dataclass(slots=True)
+class GroupData:
+    """Tree data for group, lazily populated and action nodes."""
+
+    search: str = ""  # Lowercase label
+    lazy: str | None = None  # tiger, canvec or nrn until the leaves are added
+    state_code: str | None = None
+    leaf_search: str | None = None  # Joined search text of the lazy leaves
+    action: str | None = None
+
+
+# Data attached to every source tree node
+NodeData = GroupData | SourceLeaf
+
+
+def source_leaf(label: str, uri: str, info: dict[str, Any], state: str) -> SourceLeaf:
+    """Build the tree data for a source, precomputing its search and info text."""
+    description = info.get("description", "")
+    info_text = (
+        f"URI: {uri}\n\n"
+        f"Region: {state}\n"
+        f"Type: {info.get('geometry', 'unknown')}\n"
+        f"Description: {description}\n"
+    )
+    if info.get("features"):
+        info_text += f"Features: ~{info['features']}\n"
+    search = f"{label}\n{uri}\n{description}".lower()
+    return SourceLeaf(uri, info, state, search, info_text)
+
+
+# Seconds of typing inactivity before the source tree is filtered
+SEARCH_DELAY = 0.12
+
+# Shorter queries match nearly everything, so they leave the tree as it is
+MIN_SEARCH_LENGTH = 2
+
+# Seconds a source's cached-locally status is remembered
+CACHE_STATUS_TTL = 60
+
 
 class SourceBrowserScreen(Screen):
     """Browse and select data sources for the recipe."""
@@ -104,7 +187,14 @@ class SourceBrowserScreen(Screen):
 
     def __init__(self) -> None:
         super().__init__()
-        self.selected_sources: dict[str, dict] = {}  # uri -> {name, description}
+        self.selected_sources: dict[str, dict[str, str]] = {}  # uri -> {name, description}
+        self._selected_rows: list[str] = []  # URIs in selected list order
+        self._last_query = ""
+        # Nodes matching _last_query, children first
+        self._last_matches: list[TreeNode[NodeData]] = []
+        self._filter_timer: Timer | None = None
+        self._cache_status: dict[str, bool] = {}  # uri -> is_cached(uri)
+        self._flat_nodes: list[TreeNode[NodeData]] = []  # Every tree node, children before parents
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -115,7 +205,7 @@ class SourceBrowserScreen(Screen):
             Horizontal(
                 Vertical(
                     Static("Available Sources", classes="panel-title"),
-                    Tree("Data Sources", id="source-tree"),
+                    Tree[NodeData]("Data Sources", id="source-tree"),
                     id="tree-panel",
                 ),
                 Vertical(
@@ -145,131 +235,162 @@ class SourceBrowserScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
-        """Build the source tree on mount."""
-        tree = self.query_one("#source-tree", Tree)
+        """Resolve the widgets used after mount and build the source tree."""
+        tree: Tree[NodeData] = self.query_one("#source-tree", Tree)
+        self._tree = tree
+        self._info_panel: Static = self.query_one("#info-text", Static)
+        self._selected_list: ListView = self.query_one("#selected-list", ListView)
+        self._selected_title: Static = self.query_one("#selected-title", Static)
+        self._search_box: Input = self.query_one("#search-box", Input)
         tree.show_root = False
 
-        # US Census TIGER data
-        census_node = tree.root.add("US Census TIGER/Line (2023)", expand=False)
-
-        # Group states by region for easier navigation
-        regions = {
-            "New England": ["ct", "me", "ma", "nh", "ri", "vt"],
-            "Mid-Atlantic": ["nj", "ny", "pa"],
-            "South Atlantic": ["de", "dc", "fl", "ga", "md", "nc", "sc", "va", "wv"],
-            "East South Central": ["al", "ky", "ms", "tn"],
-            "West South Central": ["ar", "la", "ok", "tx"],
-            "East North Central": ["il", "in", "mi", "oh", "wi"],
-            "West North Central": ["ia", "ks", "mn", "mo", "ne", "nd", "sd"],
-            "Mountain": ["az", "co", "id", "mt", "nv", "nm", "ut", "wy"],
-            "Pacific": ["ak", "ca", "hi", "or", "wa"],
-            "Territories": ["pr"],
-        }
-
-        for region_name, state_codes in regions.items():
-            region_node = census_node.add(region_name, expand=False)
-            for state_code in state_codes:
-                if state_code in US_STATES:
-                    state_info = US_STATES[state_code]
-                    state_node = region_node.add(
-                        f"{state_info['name']} ({state_code.upper()})",
-                        expand=False,
+        # Build the whole tree as one batch rather than repainting per node
+        with self.app.batch_update():
+            # US Census TIGER data
+            census_node = tree.root.add("US Census TIGER/Line (2023)", expand=False)
+
+            # Layer leaves are added when a state is first expanded (see _populate_node)
+            for region_name, states in CENSUS_REGIONS:
+                region_node = census_node.add(region_name, expand=False)
+                for state_code, label in states:
+                    region_node.add(
+                        label, data=GroupData(lazy="tiger", state_code=state_code), expand=False
                     )
-                    # Add layer types under each state
-                    for layer_code, layer_info in TIGER_LAYERS.items():
-                        uri = f"census:tiger/2023/{state_code}/{layer_code}"
-                        state_node.add_leaf(
-                            f"{layer_info['name']}",
-                            data={"uri": uri, "info": layer_info, "state": state_info["name"]},
-                        )
-
-        # Quebec data
-        quebec_node = tree.root.add("Quebec (Canada)", expand=False)
-        for layer_code, layer_info in QUEBEC_LAYERS.items():
-            uri = f"quebec:{layer_code}"
-            quebec_node.add_leaf(
-                f"{layer_info['name']}",
-                data={"uri": uri, "info": layer_info, "state": "Quebec"},
-            )
 
-        # Canada-wide data (CanVec, NRN)
-        canada_node = tree.root.add("Canada (National)", expand=False)
+            # Quebec data
+            quebec_node = tree.root.add("Quebec (Canada)", expand=False)
+            for layer in QUEBEC_LAYERS.values():
+                quebec_node.add_leaf(
+                    layer.name,
+                    data=source_leaf(layer.name, f"quebec:{layer.code}", layer._asdict(), "Quebec"),
+                )
 
-        # CanVec hydro
-        canvec_node = canada_node.add("CanVec (Natural Resources Canada)", expand=False)
-        for layer_code, layer_info in CANADA_LAYERS.items():
-            canvec_node.add_leaf(
-                f"{layer_info['name']}",
-                data={"uri": layer_info["uri"], "info": layer_info, "state": "Canada"},
-            )
+            # Canada-wide data (CanVec, NRN)
+            canada_node = tree.root.add("Canada (National)", expand=False)
 
-        # NRN roads by province
-        nrn_node = canada_node.add("NRN Roads (Statistics Canada)", expand=False)
-        for prov_code, prov_info in NRN_PROVINCES.items():
-            uri = f"canada:nrn/{prov_code}"
-            nrn_node.add_leaf(
-                f"{prov_info['name']} Roads",
-                data={
-                    "uri": uri,
-                    "info": {
-                        "name": f"NRN Roads - {prov_info['name']}",
-                        "description": f"National Road Network for {prov_info['name']}",
-                        "geometry": "line",
-                    },
-                    "state": prov_info["name"],
-                },
+            # CanVec hydro and NRN roads by province, populated on first expand
+            canada_node.add(
+                "CanVec (Natural Resources Canada)", data=GroupData(lazy="canvec"), expand=False
+            )
+            canada_node.add(
+                "NRN Roads (Statistics Canada)", data=GroupData(lazy="nrn"), expand=False
             )
 
-        # Custom sources section
-        custom_node = tree.root.add("Custom Sources", expand=False)
-        custom_node.add_leaf("+ Add file path...", data={"action": "add_file"})
-        custom_node.add_leaf("+ Add URL...", data={"action": "add_url"})
-
-        # Expand census by default to show regions
-        census_node.expand()
-
-    def on_tree_node_selected(self, event: Tree.NodeSelected) -> None:
+            # Custom sources section
+            custom_node = tree.root.add("Custom Sources", expand=False)
+            custom_node.add_leaf("+ Add file path...", data=GroupData(action="add_file"))
+            custom_node.add_leaf("+ Add URL...", data=GroupData(action="add_url"))
+
+            # Flat post-order index of the tree with each group's search text filled in,
+            # so filtering scans a list instead of walking the tree
+            stack = [(child, False) for child in reversed(tree.root.children)]
+            while stack:
+                node, children_done = stack.pop()
+                if children_done:
+                    self._index_node(node)
+                    self._flat_nodes.append(node)
+                else:
+                    stack.append((node, True))
+                    stack.extend((child, False) for child in reversed(node.children))
+
+            # Expand census by default to show regions
+            census_node.expand()
+
+        # Forget cache status periodically so newly fetched sources show up
+        self.set_interval(CACHE_STATUS_TTL, self._cache_status.clear)
+
+    def on_tree_node_selected(self, event: Tree.NodeSelected[NodeData]) -> None:
         """Handle tree node selection - show info panel."""
-        node = event.node
-        if node.data and isinstance(node.data, dict):
-            if "uri" in node.data:
-                info = node.data["info"]
-                state = node.data.get("state", "")
-                uri = node.data["uri"]
-
-                info_text = (
-                    f"URI: {uri}\n\n"
-                    f"Region: {state}\n"
-                    f"Type: {info.get('geometry', 'unknown')}\n"
-                    f"Description: {info.get('description', '')}\n"
+        data = event.node.data
+        if isinstance(data, SourceLeaf):
+            info_text = data.info_text
+            if self._is_cached(data.uri):
+                info_text += "\n[cached locally]"
+            self._info_panel.update(info_text)
+
+    def _is_cached(self, uri: str) -> bool:
+        """Check whether uri is cached locally, remembering the answer for a while."""
+        cached = self._cache_status.get(uri)
+        if cached is None:
+            # Imported here: strata.thoreau pulls in geopandas
+            try:
+                from strata.thoreau.cache import is_cached
+                cached = is_cached(uri)
+            except Exception:
+                cached = False
+            self._cache_status[uri] = cached
+        return cached
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded[NodeData]) -> None:
+        """Populate lazy subtrees the first time they're expanded."""
+        self._populate_node(event.node)
+
+    @staticmethod
+    def _lazy_leaves(data: GroupData) -> list[tuple[str, SourceLeaf]]:
+        """Leaf labels and data for a lazily populated node."""
+        if data.lazy == "tiger" and data.state_code:
+            state_code = data.state_code
+            state = US_STATES[state_code]
+            return [
+                (
+                    layer_info["name"],
+                    source_leaf(
+                        layer_info["name"],
+                        f"census:tiger/2023/{state_code}/{layer_code}",
+                        layer_info,
+                        state.name,
+                    ),
                 )
+                for layer_code, layer_info in TIGER_INFO
+            ]
+        if data.lazy == "canvec":
+            return [
+                (
+                    layer_info["name"],
+                    source_leaf(layer_info["name"], layer_info["uri"], layer_info, "Canada"),
+                )
+                for layer_info in CANADA_LAYERS.values()
+            ]
+        if data.lazy == "nrn":
+            leaves = []
+            for prov_code, prov_info in NRN_PROVINCES.items():
+                label = f"{prov_info['name']} Roads"
+                info = {
+                    "name": f"NRN Roads - {prov_info['name']}",
+                    "description": f"National Road Network for {prov_info['name']}",
+                    "geometry": "line",
+                }
+                leaves.append(
+                    (label, source_leaf(label, f"canada:nrn/{prov_code}", info, prov_info["name"]))
+                )
+            return leaves
+        return []
 
-                if "features" in info:
-                    info_text += f"Features: ~{info['features']}\n"
-
-                # Check if cached
-                try:
-                    from strata.thoreau.cache import is_cached
-                    if is_cached(uri):
-                        info_text += "\n[cached locally]"
-                except Exception:
-                    pass
-
-                self.query_one("#info-text", Static).update(info_text)
-
-    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
-        """When a node is expanded, auto-scroll to show children."""
-        pass
+    def _populate_node(self, node: TreeNode[NodeData]) -> None:
+        """Add the leaves of a lazy node, once."""
+        data = node.data
+        if not (isinstance(data, GroupData) and data.lazy):
+            return
+        leaves = [node.add_leaf(label, data=leaf) for label, leaf in self._lazy_leaves(data)]
+        # Leaves go just before their parent to keep the index in post-order
+        position = self._flat_nodes.index(node)
+        self._flat_nodes[position:position] = leaves
+        data.lazy = None
+        data.leaf_search = None
+
+    def _index_node(self, node: TreeNode[NodeData]) -> None:
+        """Give group nodes their lowercase label as search text."""
+        if node.data is None:
+            node.data = GroupData()
+        if isinstance(node.data, GroupData):
+            node.data.search = str(node.label).lower()
 
     def action_toggle_select(self) -> None:
         """Toggle selection of the current tree item."""
-        tree = self.query_one("#source-tree", Tree)
-        node = tree.cursor_node
+        node = self._tree.cursor_node
 
-        if node and node.data and isinstance(node.data, dict) and "uri" in node.data:
-            uri = node.data["uri"]
-            info = node.data["info"]
-            state = node.data.get("state", "")
+        if node and isinstance(node.data, SourceLeaf):
+            uri, info, state = node.data.uri, node.data.info, node.data.state
 
             if uri in self.selected_sources:
                 # Deselect
@@ -284,73 +405,93 @@ class SourceBrowserScreen(Screen):
                 }
                 self.notify(f"Added: {info['name']}", severity="information")
 
-            self._update_selected_list()
-
-    def _update_selected_list(self) -> None:
-        """Update the selected sources list view."""
-        list_view = self.query_one("#selected-list", ListView)
-        list_view.clear()
+            self._update_selected_list(uri)
 
-        for uri, info in self.selected_sources.items():
-            list_view.append(ListItem(Label(f"{info['name']}\n  {uri}")))
+    def _update_selected_list(self, uri: str) -> None:
+        """Add or remove the selected list row for uri to match selected_sources."""
+        list_view = self._selected_list
+        info = self.selected_sources.get(uri)
+        with self.app.batch_update():
+            if info is not None:
+                list_view.append(ListItem(Label(f"{info['name']}\n  {uri}")))
+                self._selected_rows.append(uri)
+            elif uri in self._selected_rows:
+                list_view.pop(self._selected_rows.index(uri))
+                self._selected_rows.remove(uri)
 
-        # Update count in title
-        count = len(self.selected_sources)
-        title = self.query_one("#selected-title", Static)
-        title.update(f"Selected Sources ({count})")
+            # Update count in title
+            self._selected_title.update(f"Selected Sources ({len(self.selected_sources)})")
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        """Handle search input changes."""
+        """Filter the tree once typing in the search box settles."""
         if event.input.id == "search-box":
-            self._filter_tree(event.value.lower())
+            if self._filter_timer is not None:
+                self._filter_timer.stop()
+            query = event.value.lower()
+            self._filter_timer = self.set_timer(SEARCH_DELAY, lambda: self._filter_tree(query))
 
     def _filter_tree(self, query: str) -> None:
         """Filter the tree based on search query."""
-        tree = self.query_one("#source-tree", Tree)
-
-        def filter_node(node: TreeNode, query: str) -> bool:
-            """Recursively filter nodes. Returns True if node or any child matches."""
-            # Check if this node matches
-            label = str(node.label).lower()
-            matches = query in label
-
-            # Check data for URI matches
-            if node.data and isinstance(node.data, dict):
-                if "uri" in node.data:
-                    matches = matches or query in node.data["uri"].lower()
-                if "info" in node.data:
-                    desc = node.data["info"].get("description", "").lower()
-                    matches = matches or query in desc
-
-            # Check children
-            child_matches = False
-            for child in node.children:
-                if filter_node(child, query):
-                    child_matches = True
-
-            # Show node if it matches or has matching children
-            # Note: Textual's Tree doesn't have a hide mechanism, so we expand matches
-            if matches or child_matches:
-                if not node.is_expanded and node.children:
-                    node.expand()
-                return True
-
-            return False
-
-        if query:
-            for child in tree.root.children:
-                filter_node(child, query)
-        else:
-            # Collapse all when search cleared
-            for child in tree.root.children:
-                child.collapse()
-            # Keep Census expanded
-            if tree.root.children:
-                tree.root.children[0].expand()
+        self._filter_timer = None
+        if 0 < len(query) < MIN_SEARCH_LENGTH:
+            return
+        tree = self._tree
+
+        found: list[TreeNode[NodeData]] = []
+        with self.app.batch_update():
+            if query:
+                if self._last_query and query.startswith(self._last_query):
+                    # A longer query can only match a subset of the previous matches,
+                    # whose lazy subtrees are already populated
+                    candidates = self._last_matches
+                else:
+                    candidates = self._filter_candidates(query)
+
+                # Candidates come children first, so a parent sees whether any child matched
+                # Note: Textual's Tree doesn't have a hide mechanism, so we expand matches
+                kept: set[int] = set()
+                for node in candidates:
+                    if node.data is None:
+                        continue
+                    if query in node.data.search or any(
+                        id(child) in kept for child in node.children
+                    ):
+                        kept.add(id(node))
+                        if not node.is_expanded and node.children:
+                            node.expand()
+                        found.append(node)
+            else:
+                # Collapse all when search cleared, keeping Census (the first) expanded
+                children = tree.root.children
+                if children and not children[0].is_expanded:
+                    children[0].expand()
+                for child in children[1:]:
+                    if child.is_expanded:
+                        child.collapse()
+        self._last_query = query
+        self._last_matches = found
+
+    def _filter_candidates(self, query: str) -> list[TreeNode[NodeData]]:
+        """
+        Populate lazy nodes that, or whose future leaves, match the query.
+
+        Returns the flat index of every node, children before parents.
+        """
+        lazy_nodes = [
+            (node, node.data)
+            for node in self._flat_nodes
+            if isinstance(node.data, GroupData) and node.data.lazy
+        ]
+        for node, data in lazy_nodes:
+            if data.leaf_search is None:
+                data.leaf_search = "\n".join(leaf.search for _, leaf in self._lazy_leaves(data))
+            if query in data.search or query in data.leaf_search:
+                self._populate_node(node)
+        return self._flat_nodes
 
     def action_focus_search(self) -> None:
         """Focus the search box."""
-        self.query_one("#search-box", Input).focus()
+        self._search_box.focus()
 
     def action_add_custom(self) -> None:
         """Add a custom source."""
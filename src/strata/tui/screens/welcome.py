@@ -6,6 +6,20 @@ from textual.containers import Container, Vertical
 from textual.screen import Screen
 from textual.widgets import Button, Footer, Header, Input, Label, Static
 
+LOGO = """
+╔═╗╔╦╗╦═╗╔═╗╔╦╗╔═╗
+╚═╗ ║ ╠╦╝╠═╣ ║ ╠═╣
+╚═╝ ╩ ╩╚═╩ ╩ ╩ ╩ ╩  Recipe Builder
+                """
+
+INTRO = (
+    "\nLet's create a new map recipe.\n\n"
+    "A recipe defines:\n"
+    "  - Where to get geographic data (sources)\n"
+    "  - How to process it (layers with operations)\n"
+    "  - What to output (SVG, GeoJSON, tiles)\n"
+)
+
 
 class WelcomeScreen(Screen):
     """Welcome screen - Step 1: Recipe name and description."""
@@ -18,23 +32,9 @@ class WelcomeScreen(Screen):
     def compose(self) -> ComposeResult:
         yield Header()
         yield Container(
-            Static(
-                """
-╔═╗╔╦╗╦═╗╔═╗╔╦╗╔═╗
-╚═╗ ║ ╠╦╝╠═╣ ║ ╠═╣
-╚═╝ ╩ ╩╚═╩ ╩ ╩ ╩ ╩  Recipe Builder
-                """,
-                id="logo",
-            ),
+            Static(LOGO, id="logo"),
             Static("[1/5] Welcome", id="step"),
-            Static(
-                "\nLet's create a new map recipe.\n\n"
-                "A recipe defines:\n"
-                "  - Where to get geographic data (sources)\n"
-                "  - How to process it (layers with operations)\n"
-                "  - What to output (SVG, GeoJSON, tiles)\n",
-                id="intro",
-            ),
+            Static(INTRO, id="intro"),
             Vertical(
                 Label("Recipe name:"),
                 Input(placeholder="hawaii_islands", id="name"),
@@ -55,8 +55,10 @@ class WelcomeScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
-        """Focus the name input on mount."""
-        self.query_one("#name", Input).focus()
+        """Resolve the inputs and focus the name input on mount."""
+        self._name_input = self.query_one("#name", Input)
+        self._description_input = self.query_one("#description", Input)
+        self._name_input.focus()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -65,8 +67,8 @@ class WelcomeScreen(Screen):
 
     def action_next(self) -> None:
         """Move to source browser screen."""
-        name_input = self.query_one("#name", Input)
-        desc_input = self.query_one("#description", Input)
+        name_input = self._name_input
+        desc_input = self._description_input
 
         # Validate name
         name = name_input.value.strip()
@@ -0,0 +1,14 @@
+"""Tests for the bounds screen presets."""
+
+from strata.tui.screens.bounds import PRESET_BOUNDS, nearest_preset
+
+
+def test_nearest_preset_exact():
+    """Each preset's own bounds map back to that preset."""
+    for key, preset in PRESET_BOUNDS.items():
+        assert nearest_preset(preset["bounds"]) == key
+
+
+def test_nearest_preset_close():
+    """A box slightly off a preset snaps to it."""
+    assert nearest_preset([-158.2, 21.3, -157.7, 21.7]) == "oahu"
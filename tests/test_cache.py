@@ -0,0 +1,113 @@
+"""Tests for cache entry bookkeeping."""
+
+import os
+import time
+import zipfile
+
+import pytest
+
+from strata.thoreau import cache
+from strata.thoreau.cache import (
+    FRESHNESS_CHECK_TTL,
+    MANIFEST_NAME,
+    entry_lock,
+    extract_archive,
+    freshness_check_due,
+    get_cached_path,
+    is_cached,
+    mark_checked,
+    mark_incomplete,
+    read_manifest,
+    write_manifest,
+)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point the strata cache at a temporary directory."""
+    monkeypatch.setattr(cache, "get_cache_dir", lambda: tmp_path)
+    get_cached_path.cache_clear()
+    yield tmp_path
+    get_cached_path.cache_clear()
+
+
+def test_manifest_round_trip(cache_dir):
+    """A written manifest makes the entry a cache hit listing its files."""
+    uri = "census:tiger/2023/vt/cousub"
+    entry = get_cached_path(uri)
+    entry.mkdir(parents=True)
+    data = entry / "tl_2023_50_cousub.shp"
+    data.touch()
+
+    write_manifest(entry, [data], {"https://example.com/a.zip": {"etag": "x"}})
+
+    assert is_cached(uri)
+    assert read_manifest(entry) == [data]
+
+
+def test_partial_entry_is_a_miss(cache_dir):
+    """An interrupted download isn't served, even with data files on disk."""
+    uri = "census:tiger/2023/vt/cousub"
+    entry = get_cached_path(uri)
+    entry.mkdir(parents=True)
+    data = entry / "tl_2023_50_cousub.shp"
+    data.touch()
+    write_manifest(entry, [data])
+
+    mark_incomplete(entry)
+
+    assert not is_cached(uri)
+    assert read_manifest(entry) is None
+
+
+def test_entry_lock_creates_entry(tmp_path):
+    """Taking the lock creates the entry directory and can be repeated."""
+    entry = tmp_path / "entry"
+    with entry_lock(entry):
+        assert entry.is_dir()
+    with entry_lock(entry):
+        pass
+
+
+def test_freshness_check_waits_for_ttl(tmp_path):
+    """A new entry isn't checked again until the TTL passes, then once more."""
+    write_manifest(tmp_path, [])
+    assert not freshness_check_due(tmp_path)
+
+    old = time.time() - FRESHNESS_CHECK_TTL - 1
+    os.utime(tmp_path / MANIFEST_NAME, (old, old))
+    assert freshness_check_due(tmp_path)
+
+    mark_checked(tmp_path)
+    assert not freshness_check_due(tmp_path)
+
+
+def test_freshness_check_without_manifest(tmp_path):
+    """Entries without a manifest are never checked."""
+    assert not freshness_check_due(tmp_path)
+
+
+def test_extract_archive(tmp_path):
+    """Members, including nested ones, are extracted under the destination."""
+    archive = tmp_path / "data.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("a.shp", b"shape")
+        zf.writestr("nested/b.dbf", b"table")
+
+    with zipfile.ZipFile(archive) as zf:
+        extract_archive(zf, tmp_path / "out")
+
+    assert (tmp_path / "out" / "a.shp").read_bytes() == b"shape"
+    assert (tmp_path / "out" / "nested" / "b.dbf").read_bytes() == b"table"
+
+
+def test_extract_archive_rejects_traversal(tmp_path):
+    """Members that would land outside the destination are refused."""
+    archive = tmp_path / "evil.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("../escaped.txt", b"nope")
+
+    with zipfile.ZipFile(archive) as zf, pytest.raises(ValueError, match="Unsafe path"):
+        extract_archive(zf, tmp_path / "out")
+
+    assert not (tmp_path / "escaped.txt").exists()
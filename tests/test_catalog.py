@@ -0,0 +1,50 @@
+"""Tests for the TUI data source catalog."""
+
+import pytest
+
+from strata.tui.catalog import filter_catalog, get_full_catalog, lookup_state
+
+
+@pytest.mark.parametrize("query", ["vt", "VT", "50", "Vermont", "vermont", " VERMONT "])
+def test_lookup_state(query):
+    """States are found by postal code, FIPS code or name, ignoring case."""
+    state = lookup_state(query)
+    assert state is not None
+    assert (state.code, state.fips, state.name) == ("vt", "50", "Vermont")
+
+
+def test_lookup_state_miss():
+    """Unknown states return None."""
+    assert lookup_state("Atlantis") is None
+    assert lookup_state("99") is None
+
+
+@pytest.mark.parametrize(
+    "criteria",
+    [
+        {},
+        {"region": "Vermont"},
+        {"geometry": "line"},
+        {"source_type": "quebec"},
+        {"source_type": "census", "geometry": "polygon", "query": "water"},
+        {"query": "NRN"},
+        {"region": "Atlantis"},
+    ],
+)
+def test_filter_catalog_matches_list_filter(criteria):
+    """filter_catalog returns what a plain loop over the catalog would."""
+    query = criteria.get("query")
+    expected = [
+        entry
+        for entry in get_full_catalog()
+        if all(
+            getattr(entry, field) == criteria[field]
+            for field in ("region", "geometry", "source_type")
+            if field in criteria
+        )
+        and (
+            query is None
+            or query.lower() in f"{entry.name}\n{entry.uri}\n{entry.description}".lower()
+        )
+    ]
+    assert list(filter_catalog(**criteria)) == expected
@@ -0,0 +1,35 @@
+"""Tests for Census TIGER county merging."""
+
+import geopandas as gpd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from shapely.geometry import Point
+
+from strata.thoreau.census import _geo_metadata, _merge_parquet
+
+
+def _write_part(path, gdf):
+    pq.write_table(pa.table(gdf.to_arrow(index=False, geometry_encoding="WKB")), path)
+    return path
+
+
+def test_merge_counties_with_different_schemas(tmp_path):
+    """Counties with different columns are merged without dropping rows."""
+    first = gpd.GeoDataFrame({"NAME": ["a"]}, geometry=[Point(0, 0)], crs=4326)
+    second = gpd.GeoDataFrame(
+        {"NAME": ["b", "c"], "AWATER": [1, 2]}, geometry=[Point(1, 1), Point(2, 2)], crs=4326
+    )
+    parts = [
+        _write_part(tmp_path / "1.parquet", first),
+        _write_part(tmp_path / "2.parquet", second),
+    ]
+
+    merged_path = tmp_path / "merged.parquet"
+    rows = _merge_parquet(parts, merged_path, _geo_metadata(first))
+
+    merged = gpd.read_parquet(merged_path)
+    assert rows == len(merged) == 3
+    assert merged["NAME"].tolist() == ["a", "b", "c"]
+    assert merged["AWATER"].isna().tolist() == [True, False, False]
+    assert merged.crs == first.crs
+    assert pq.ParquetFile(merged_path).num_row_groups == 2
@@ -0,0 +1,23 @@
+"""Tests for fetching several sources at once."""
+
+import pytest
+
+from strata.thoreau import fetch_many
+
+
+def test_fetch_many_return_exceptions(tmp_path):
+    """Failures are returned in place, in input order, alongside the paths."""
+    present = tmp_path / "present.geojson"
+    present.write_text("{}")
+    missing = tmp_path / "missing.geojson"
+
+    results = fetch_many([f"file:{missing}", f"file:{present}"], return_exceptions=True)
+
+    assert isinstance(results[0], FileNotFoundError)
+    assert results[1] == str(present)
+
+
+def test_fetch_many_raises_first_failure(tmp_path):
+    """Without return_exceptions the first failure is raised."""
+    with pytest.raises(FileNotFoundError):
+        fetch_many([f"file:{tmp_path / 'missing.geojson'}"])
@@ -20,9 +20,15 @@ output:
 """
 
 
-def test_parse_minimal_recipe():
+@pytest.fixture(scope="module")
+def minimal_recipe():
+    """MINIMAL_RECIPE parsed once for the tests that only read it."""
+    return Recipe.from_yaml(MINIMAL_RECIPE)
+
+
+def test_parse_minimal_recipe(minimal_recipe):
     """Test parsing a minimal valid recipe."""
-    recipe = Recipe.from_yaml(MINIMAL_RECIPE)
+    recipe = minimal_recipe
     assert recipe.name == "test_map"
     assert "towns" in recipe.sources
     assert len(recipe.layers) == 1
@@ -70,9 +76,16 @@ output:
         Recipe.from_yaml(bad_bounds)
 
 
-def test_to_yaml():
+def test_to_yaml(minimal_recipe):
     """Test YAML export."""
-    recipe = Recipe.from_yaml(MINIMAL_RECIPE)
-    yaml_output = recipe.to_yaml()
+    yaml_output = minimal_recipe.to_yaml()
     assert "name: test_map" in yaml_output
     assert "census:tiger/2023/vt/cousub" in yaml_output
+
+
+def test_peek_header(tmp_path):
+    """Test reading the recipe header without a full load."""
+    path = tmp_path / "test.strata.yaml"
+    path.write_text("# Test map\n" + MINIMAL_RECIPE)
+    header = Recipe.peek_header(path)
+    assert header == {"name": "test_map", "version": 1, "description": ""}